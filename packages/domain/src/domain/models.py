@@ -1,9 +1,10 @@
 """Domain models for options trading and probability estimation."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict
 
 from .types import Symbol, TickSize
 
@@ -22,9 +23,10 @@ class OptionQuoteEvent:
     ts: datetime
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class OptionState:
-    """Latest state of an option contract."""
+    """Latest state of an option contract. Immutable — the store replaces the
+    whole state on each quote, so readers can hold references safely."""
 
     occ_symbol: str  # e.g., "O:NVDA260117C00140000"
     symbol: Symbol  # e.g., "NVDA"
@@ -55,6 +57,15 @@ class OptionPoint:
     spread: float
 
 
+def _strike_key(strike: float) -> int:
+    """Scale a strike to integer thousandths (OCC precision).
+
+    Integer keys hash faster than floats and make index lookups immune to
+    float-representation noise (e.g. 110.00000000001 from JSON).
+    """
+    return round(strike * 1000)
+
+
 @dataclass(frozen=True, slots=True)
 class OptionSurfaceSnapshot:
     """Immutable snapshot of an option surface for one symbol and expiry."""
@@ -64,29 +75,131 @@ class OptionSurfaceSnapshot:
     calls: tuple["OptionPoint", ...]
     puts: tuple["OptionPoint", ...]
 
+    # Lazy strike-key -> point indexes so repeated lookups are O(1) instead of
+    # scanning the tuples. Built on first access; safe to cache since frozen.
+    _call_index: dict[int, "OptionPoint"] | None = field(default=None, init=False, repr=False, compare=False)
+    _put_index: dict[int, "OptionPoint"] | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Lazy per-field column caches — estimators query these every tick, and
+    # the snapshot is immutable, so extract each column at most once.
+    _call_strikes: list[float] | None = field(default=None, init=False, repr=False, compare=False)
+    _call_mids: list[float] | None = field(default=None, init=False, repr=False, compare=False)
+    _call_spreads: list[float] | None = field(default=None, init=False, repr=False, compare=False)
+    _put_strikes: list[float] | None = field(default=None, init=False, repr=False, compare=False)
+    _all_strikes: list[float] | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Lazy SoA (structure-of-arrays) caches — NumPy columns per side plus the
+    # strikes quoted on both sides, so estimators can vectorize end to end.
+    _call_columns: tuple[np.ndarray, np.ndarray, np.ndarray] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _put_columns: tuple[np.ndarray, np.ndarray, np.ndarray] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _paired_columns: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def call_strikes(self) -> list[float]:
-        return [p.strike for p in self.calls]
+        strikes = self._call_strikes
+        if strikes is None:
+            strikes = [p.strike for p in self.calls]
+            object.__setattr__(self, "_call_strikes", strikes)
+        return strikes
+
+    @property
+    def call_mids(self) -> list[float]:
+        mids = self._call_mids
+        if mids is None:
+            mids = [p.mid for p in self.calls]
+            object.__setattr__(self, "_call_mids", mids)
+        return mids
+
+    @property
+    def call_spreads(self) -> list[float]:
+        spreads = self._call_spreads
+        if spreads is None:
+            spreads = [p.spread for p in self.calls]
+            object.__setattr__(self, "_call_spreads", spreads)
+        return spreads
 
     @property
     def put_strikes(self) -> list[float]:
-        return [p.strike for p in self.puts]
+        strikes = self._put_strikes
+        if strikes is None:
+            strikes = [p.strike for p in self.puts]
+            object.__setattr__(self, "_put_strikes", strikes)
+        return strikes
 
     @property
     def all_strikes(self) -> list[float]:
-        return sorted(set(self.call_strikes + self.put_strikes))
+        strikes = self._all_strikes
+        if strikes is None:
+            strikes = sorted({p.strike for p in self.calls}.union(p.strike for p in self.puts))
+            object.__setattr__(self, "_all_strikes", strikes)
+        return strikes
+
+    @property
+    def call_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Call-side (strikes, mids, spreads) as float64 arrays, strike-ascending."""
+        cols = self._call_columns
+        if cols is None:
+            cols = (
+                np.array([p.strike for p in self.calls], dtype=np.float64),
+                np.array([p.mid for p in self.calls], dtype=np.float64),
+                np.array([p.spread for p in self.calls], dtype=np.float64),
+            )
+            object.__setattr__(self, "_call_columns", cols)
+        return cols
+
+    @property
+    def put_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Put-side (strikes, mids, spreads) as float64 arrays, strike-ascending."""
+        cols = self._put_columns
+        if cols is None:
+            cols = (
+                np.array([p.strike for p in self.puts], dtype=np.float64),
+                np.array([p.mid for p in self.puts], dtype=np.float64),
+                np.array([p.spread for p in self.puts], dtype=np.float64),
+            )
+            object.__setattr__(self, "_put_columns", cols)
+        return cols
+
+    @property
+    def paired_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(strikes, call_mid, call_spread, put_mid, put_spread) for strikes quoted on both sides.
+
+        Matching uses integer-thousandth strike keys (OCC precision), the same
+        convention as get_call/get_put.
+        """
+        cols = self._paired_columns
+        if cols is None:
+            ck, cm, cs = self.call_columns
+            pk, pm, ps = self.put_columns
+            _, ci, pi = np.intersect1d(
+                np.rint(ck * 1000).astype(np.int64),
+                np.rint(pk * 1000).astype(np.int64),
+                assume_unique=True,
+                return_indices=True,
+            )
+            cols = (ck[ci], cm[ci], cs[ci], pm[pi], ps[pi])
+            object.__setattr__(self, "_paired_columns", cols)
+        return cols
 
     def get_call(self, strike: float) -> OptionPoint | None:
-        for p in self.calls:
-            if p.strike == strike:
-                return p
-        return None
+        index = self._call_index
+        if index is None:
+            index = {_strike_key(p.strike): p for p in self.calls}
+            object.__setattr__(self, "_call_index", index)
+        return index.get(_strike_key(strike))
 
     def get_put(self, strike: float) -> OptionPoint | None:
-        for p in self.puts:
-            if p.strike == strike:
-                return p
-        return None
+        index = self._put_index
+        if index is None:
+            index = {_strike_key(p.strike): p for p in self.puts}
+            object.__setattr__(self, "_put_index", index)
+        return index.get(_strike_key(strike))
 
 
 # ---------------------------------------------------------------------
@@ -118,7 +231,7 @@ class ConfidenceDiagnostics:
     spacing: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelPrediction:
     """Single model's probability prediction."""
 
@@ -134,7 +247,7 @@ class ModelPrediction:
         return 1.0 - self.prob_above
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpiryPredictions:
     """All model predictions for one expiry."""
 
@@ -150,7 +263,10 @@ class ExpiryPredictions:
 
 
 class MarketMetadata(BaseModel):
-    """Polymarket stock price prediction market metadata."""
+    """Polymarket stock price prediction market metadata. Frozen: instances
+    are shared between the store's indexes and readers."""
+
+    model_config = ConfigDict(frozen=True)
 
     question: str | None = None
     question_id: str | None = None
@@ -165,7 +281,10 @@ class MarketMetadata(BaseModel):
 
 
 class EventMetadata(BaseModel):
-    """Polymarket stock price prediction event metadata."""
+    """Polymarket stock price prediction event metadata. Frozen: instances
+    are shared between the store's indexes and readers."""
+
+    model_config = ConfigDict(frozen=True)
 
     symbol: Symbol | None = None
     question: str | None = None
@@ -1,41 +1,79 @@
 """Discord notification integration."""
 
+import asyncio
+import functools
+import json
 import logging
-from typing import Literal
-
-import requests
+from typing import TYPE_CHECKING, Literal
 
 from .secrets import load_optional_secret
 
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
 NotificationLevel = Literal["info", "warning", "error", "success"]
 
 
-def _format_message(message: str, level: NotificationLevel) -> dict:
-    """Format message for Discord webhook."""
-    color_map = {
-        "info": 0x3498DB,  # Blue
-        "success": 0x2ECC71,  # Green
-        "warning": 0xF39C12,  # Orange
-        "error": 0xE74C3C,  # Red
-    }
-
-    emoji_map = {
-        "info": "ℹ️",
-        "success": "✅",
-        "warning": "⚠️",
-        "error": "❌",
-    }
-
-    return {
-        "embeds": [
-            {
-                "description": f"{emoji_map[level]} {message}",
-                "color": color_map[level],
-            }
-        ]
-    }
+@functools.cache
+def _get_session() -> "requests.Session":
+    """Shared session so bursty notifications reuse one keep-alive connection
+    to Discord instead of paying a TLS handshake per send.
+
+    Built lazily: importing requests (and its urllib3 chain) is deferred
+    until a notification is actually sent, so processes with no webhook
+    configured never pay the import cost.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+        ),
+    )
+    return session
+
+
+# (emoji, embed color) per notification level
+_LEVEL_STYLES: dict[NotificationLevel, tuple[str, int]] = {
+    "info": ("ℹ️", 0x3498DB),  # Blue
+    "success": ("✅", 0x2ECC71),  # Green
+    "warning": ("⚠️", 0xF39C12),  # Orange
+    "error": ("❌", 0xE74C3C),  # Red
+}
+
+# Precompiled payload parts: only the description text varies per send,
+# so the JSON skeleton around it is built once per level at import
+_PREFIX: dict[NotificationLevel, str] = {level: f"{emoji} " for level, (emoji, _) in _LEVEL_STYLES.items()}
+_PAYLOAD_PREFIX = '{"embeds":[{"description":'
+_PAYLOAD_SUFFIX: dict[NotificationLevel, str] = {
+    level: f',"color":{color}}}]}}' for level, (_, color) in _LEVEL_STYLES.items()
+}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+try:  # optional: orjson escapes strings ~5-10x faster than stdlib json
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    def _dump_str(text: str) -> str:
+        return orjson.dumps(text).decode()
+
+except ImportError:
+
+    def _dump_str(text: str) -> str:
+        return json.dumps(text)
+
+
+def _format_message_json(message: str, level: NotificationLevel) -> bytes:
+    """Serialize the Discord webhook payload for a message."""
+    description = _dump_str(_PREFIX[level] + message)
+    return (_PAYLOAD_PREFIX + description + _PAYLOAD_SUFFIX[level]).encode()
 
 
 def send_notification(message: str, level: NotificationLevel = "info") -> None:
@@ -51,12 +89,50 @@ def send_notification(message: str, level: NotificationLevel = "info") -> None:
         logger.debug("Discord webhook URL not configured, skipping notification")
         return
 
+    import requests
+
     try:
-        payload = _format_message(message, level)
-        response = requests.post(webhook_url, json=payload, timeout=5)
+        payload = _format_message_json(message, level)
+        response = _get_session().post(webhook_url, data=payload, headers=_JSON_HEADERS, timeout=5)
         response.raise_for_status()
         logger.debug(f"Discord notification sent: {level}")
     except requests.RequestException as e:
         logger.warning(f"Failed to send Discord notification: {e}")
     except Exception as e:
         logger.error(f"Unexpected error sending Discord notification: {e}")
+
+
+# ---------------------------------------------------------------------
+# Async fire-and-forget path
+# ---------------------------------------------------------------------
+
+_queue: asyncio.Queue[tuple[str, NotificationLevel]] | None = None
+_worker: asyncio.Task | None = None
+
+
+async def _drain_notifications(queue: asyncio.Queue[tuple[str, NotificationLevel]]) -> None:
+    """Send queued notifications one at a time off the event loop."""
+    while True:
+        message, level = await queue.get()
+        try:
+            # The pooled session already retries 429/5xx with backoff
+            await asyncio.to_thread(send_notification, message, level)
+        except Exception:
+            logger.exception("Notification worker failed")
+        finally:
+            queue.task_done()
+
+
+async def send_notification_async(message: str, level: NotificationLevel = "info") -> None:
+    """
+    Enqueue a notification without blocking the event loop.
+
+    A background task drains the queue, so bursty callers return in
+    microseconds instead of waiting out a full webhook round trip.
+    """
+    global _queue, _worker
+    if _queue is None:
+        _queue = asyncio.Queue()
+    if _worker is None or _worker.done():
+        _worker = asyncio.get_running_loop().create_task(_drain_notifications(_queue))
+    _queue.put_nowait((message, level))
@@ -1,8 +1,10 @@
+import functools
 import os
-from pathlib import Path
 
 from domain.errors import ConfigurationError
 
+_SECRETS_DIR = "/run/secrets"
+
 
 def load_required_secret(name: str, error_message: str | None = None) -> str:
     """Load a secret from Docker secrets or environment variables.
@@ -25,6 +27,7 @@ def load_required_secret(name: str, error_message: str | None = None) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=256)
 def load_optional_secret(name: str) -> str | None:
     """Load an optional secret from Docker secrets or environment variables.
 
@@ -38,12 +41,26 @@ def load_optional_secret(name: str) -> str | None:
     return read_docker_secret(name) or os.getenv(name)
 
 
+@functools.lru_cache(maxsize=256)
 def read_docker_secret(name: str) -> str | None:
-    """Read a Docker secret from /run/secrets."""
-    secret_path = Path("/run/secrets") / name
+    """Read a Docker secret from /run/secrets.
+
+    Secrets are immutable for the lifetime of a container, so results are
+    cached to avoid re-statting the filesystem on every lookup.
+    """
+    secret_path = os.path.join(_SECRETS_DIR, name)
 
-    if not secret_path.is_file():
+    try:
+        with open(secret_path, "rb") as f:
+            data = f.read()
+    except OSError:
         return None
 
-    value = secret_path.read_text(encoding="utf-8").strip()
+    value = data.decode("utf-8").strip()
     return value or None
+
+
+def clear_secret_cache() -> None:
+    """Clear cached secret lookups (mainly for test isolation)."""
+    read_docker_secret.cache_clear()
+    load_optional_secret.cache_clear()
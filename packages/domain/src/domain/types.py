@@ -1,12 +1,14 @@
-from datetime import UTC, datetime, time
-from typing import Annotated, Literal, TypeGuard, get_args
+import functools
+from datetime import UTC, date, datetime, time
+from typing import Annotated, Literal, TypeGuard
 
 from pydantic import BeforeValidator
 
 Outcome = Literal["YES", "NO"]
 Side = Literal["BUY", "SELL"]
 Symbol = Literal["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA", "NFLX", "PLTR", "OPEN"]
-SYMBOLS = set(get_args(Symbol))
+# Keep in sync with the Symbol literal above (asserted in tests)
+SYMBOLS: frozenset[str] = frozenset(("AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA", "NFLX", "PLTR", "OPEN"))
 TickSize = Annotated[
     Literal["0.1", "0.01", "0.001", "0.0001"], BeforeValidator(lambda v: str(v) if v is not None else v)
 ]
@@ -20,7 +22,13 @@ def is_symbol(value: str) -> TypeGuard[Symbol]:
     return value in SYMBOLS
 
 
+@functools.lru_cache(maxsize=1024)
 def make_expiry_datetime(date_str: str) -> datetime:
-    """Create expiry datetime from YYYY-MM-DD string with 21:00 UTC (4PM ET market close)."""
-    d = datetime.strptime(date_str, "%Y-%m-%d").date()
-    return datetime.combine(d, EXPIRY_TIME_UTC)
+    """Create expiry datetime from YYYY-MM-DD string with 21:00 UTC (4PM ET market close).
+
+    A chain has thousands of contracts sharing a handful of expiries, so the
+    (immutable) datetime for each date string is built once and shared.
+    """
+    # fromisoformat is C-implemented and much faster than strptime
+    d = date.fromisoformat(date_str)
+    return datetime(d.year, d.month, d.day, 21, 0, 0, tzinfo=UTC)
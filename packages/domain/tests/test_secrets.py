@@ -1,52 +1,41 @@
 """Tests for Docker secrets reading functionality."""
 
 import os
-from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import mock_open, patch
 
 import pytest
 from domain.errors import ConfigurationError
-from domain.secrets import load_required_secret, read_docker_secret
+from domain.secrets import clear_secret_cache, load_required_secret, read_docker_secret
+
+
+@pytest.fixture(autouse=True)
+def _clear_secret_cache():
+    """Keep cached secret lookups from leaking between tests."""
+    clear_secret_cache()
+    yield
+    clear_secret_cache()
 
 
 class TestReadDockerSecret:
     """Tests for read_docker_secret function."""
 
-    def test_read_existing_secret(self, tmp_path: Path) -> None:
+    def test_read_existing_secret(self) -> None:
         """Test reading an existing Docker secret file."""
         secret_name = "TEST_SECRET"
         secret_value = "my-secret-value"
 
-        # Create a temporary secrets directory
-        secrets_dir = tmp_path / "run" / "secrets"
-        secrets_dir.mkdir(parents=True)
-        secret_file = secrets_dir / secret_name
-        secret_file.write_text(secret_value)
-
-        # Mock the secrets path
-        with patch("domain.secrets.Path") as mock_path:
-            mock_secret_path = Mock()
-            mock_secret_path.is_file.return_value = True
-            mock_secret_path.read_text.return_value = secret_value
-            mock_path.return_value.__truediv__.return_value = mock_secret_path
-
+        with patch("builtins.open", mock_open(read_data=secret_value.encode())):
             result = read_docker_secret(secret_name)
 
             assert result == secret_value
-            mock_secret_path.read_text.assert_called_once_with(encoding="utf-8")
 
-    def test_read_secret_with_whitespace(self, tmp_path: Path) -> None:
+    def test_read_secret_with_whitespace(self) -> None:
         """Test reading a secret with leading/trailing whitespace."""
         secret_name = "TEST_SECRET"
         secret_value = "  my-secret-value  \n"
         expected_value = "my-secret-value"
 
-        with patch("domain.secrets.Path") as mock_path:
-            mock_secret_path = Mock()
-            mock_secret_path.is_file.return_value = True
-            mock_secret_path.read_text.return_value = secret_value
-            mock_path.return_value.__truediv__.return_value = mock_secret_path
-
+        with patch("builtins.open", mock_open(read_data=secret_value.encode())):
             result = read_docker_secret(secret_name)
 
             assert result == expected_value
@@ -55,11 +44,7 @@ class TestReadDockerSecret:
         """Test reading a non-existent Docker secret file."""
         secret_name = "NONEXISTENT_SECRET"
 
-        with patch("domain.secrets.Path") as mock_path:
-            mock_secret_path = Mock()
-            mock_secret_path.is_file.return_value = False
-            mock_path.return_value.__truediv__.return_value = mock_secret_path
-
+        with patch("builtins.open", side_effect=FileNotFoundError):
             result = read_docker_secret(secret_name)
 
             assert result is None
@@ -68,12 +53,7 @@ class TestReadDockerSecret:
         """Test reading an empty Docker secret file."""
         secret_name = "EMPTY_SECRET"
 
-        with patch("domain.secrets.Path") as mock_path:
-            mock_secret_path = Mock()
-            mock_secret_path.is_file.return_value = True
-            mock_secret_path.read_text.return_value = ""
-            mock_path.return_value.__truediv__.return_value = mock_secret_path
-
+        with patch("builtins.open", mock_open(read_data=b"")):
             result = read_docker_secret(secret_name)
 
             assert result is None
@@ -82,12 +62,7 @@ class TestReadDockerSecret:
         """Test reading a Docker secret file with only whitespace."""
         secret_name = "WHITESPACE_SECRET"
 
-        with patch("domain.secrets.Path") as mock_path:
-            mock_secret_path = Mock()
-            mock_secret_path.is_file.return_value = True
-            mock_secret_path.read_text.return_value = "   \n\t  "
-            mock_path.return_value.__truediv__.return_value = mock_secret_path
-
+        with patch("builtins.open", mock_open(read_data=b"   \n\t  ")):
             result = read_docker_secret(secret_name)
 
             assert result is None
@@ -0,0 +1,26 @@
+"""Tests for domain type helpers."""
+
+from datetime import UTC
+from typing import get_args
+
+from domain.types import SYMBOLS, Symbol, is_symbol, make_expiry_datetime
+
+
+def test_symbols_matches_symbol_literal() -> None:
+    """SYMBOLS is a hand-written frozenset; catch drift from the Symbol literal."""
+    assert SYMBOLS == frozenset(get_args(Symbol))
+
+
+def test_is_symbol_known() -> None:
+    assert is_symbol("NVDA")
+
+
+def test_is_symbol_unknown() -> None:
+    assert not is_symbol("XXXX")
+
+
+def test_make_expiry_datetime() -> None:
+    expiry = make_expiry_datetime("2026-01-17")
+    assert (expiry.year, expiry.month, expiry.day) == (2026, 1, 17)
+    assert (expiry.hour, expiry.minute, expiry.second) == (21, 0, 0)
+    assert expiry.tzinfo == UTC
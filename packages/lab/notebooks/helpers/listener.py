@@ -2,23 +2,72 @@
 Helper functions for fetching and exploring options data in notebooks.
 """
 
+import functools
+import itertools
+import operator
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
-from typing import get_args
 
+import numpy as np
 from domain.secrets import load_required_secret
 from domain.types import Symbol
 from dotenv import load_dotenv
 from massive import RESTClient
 
 load_dotenv()
-SYMBOLS = list(get_args(Symbol))
-
-
+# Keep in sync with the Symbol literal in domain.types (tuple: iteration order matters)
+SYMBOLS = ("AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA", "NFLX", "PLTR", "OPEN")
+
+# Contract row schema: dict keys paired with a C-level attribute extractor
+_CONTRACT_KEYS = (
+    "occ_symbol",
+    "symbol",
+    "strike_price",
+    "expiration_date",
+    "contract_type",
+    "shares_per_contract",
+    "exercise_style",
+)
+_CONTRACT_VALUES = operator.attrgetter(
+    "ticker",
+    "underlying_ticker",
+    "strike_price",
+    "expiration_date",
+    "contract_type",
+    "shares_per_contract",
+    "exercise_style",
+)
+
+
+# C-level multi-attribute extractors for the chain snapshot hot loop
+_QUOTE_GET = operator.attrgetter("bid", "ask")
+_DETAIL_GET = operator.attrgetter("ticker", "strike_price", "expiration_date", "contract_type")
+_GREEK_GET = operator.attrgetter("delta", "gamma", "theta", "vega")
+
+
+def _default_date_range(gte: date | None, lte: date | None, *, days: int = 30) -> tuple[date, date]:
+    """Fill missing expiration bounds from a single clock read (today .. today+days)."""
+    if gte is None or lte is None:
+        today = datetime.now(UTC).date()
+        if gte is None:
+            gte = today
+        if lte is None:
+            lte = today + timedelta(days=days)
+    return gte, lte
+
+
+@functools.cache
 def get_client() -> RESTClient:
-    """Get an authenticated Massive REST client."""
+    """Get an authenticated Massive REST client (shared process-wide)."""
     return RESTClient(api_key=load_required_secret("MASSIVE_API_KEY"))
 
 
+def reset_client() -> None:
+    """Drop the cached REST client (e.g. after rotating the API key)."""
+    get_client.cache_clear()
+
+
 def fetch_options_occ_symbols(
     expiration_gte: date | None = None,
     expiration_lte: date | None = None,
@@ -44,14 +93,9 @@ def fetch_options_occ_symbols(
     """
     client = get_client()
 
-    if expiration_gte is None:
-        expiration_gte = datetime.now(UTC).date()
-    if expiration_lte is None:
-        expiration_lte = datetime.now(UTC).date() + timedelta(days=30)
-
-    occ_symbols: list[str] = []
+    expiration_gte, expiration_lte = _default_date_range(expiration_gte, expiration_lte)
 
-    for symbol in SYMBOLS:
+    def _fetch_for_symbol(symbol: str) -> list[str]:
         try:
             contracts = client.list_options_contracts(
                 underlying_ticker=symbol,
@@ -62,18 +106,26 @@ def fetch_options_occ_symbols(
                 limit=limit_per_symbol,
             )
 
-            count = 0
+            symbols: list[str] = []
             for contract in contracts:
                 if contract.ticker:
-                    occ_symbols.append(contract.ticker)
-                    count += 1
-                    if count >= limit_per_symbol:
+                    symbols.append(contract.ticker)
+                    if len(symbols) >= limit_per_symbol:
                         break
 
-            print(f"  {symbol}: {count} contracts")
+            print(f"  {symbol}: {len(symbols)} contracts")
+            return symbols
 
         except Exception as e:
             print(f"  {symbol}: ERROR - {e}")
+            return []
+
+    occ_symbols: list[str] = []
+
+    # I/O-bound: fetch all symbols concurrently instead of serially
+    with ThreadPoolExecutor(max_workers=len(SYMBOLS)) as pool:
+        for part in pool.map(_fetch_for_symbol, SYMBOLS):
+            occ_symbols.extend(part)
 
     print(f"\nTotal: {len(occ_symbols)} option OCC symbols")
     return occ_symbols
@@ -98,14 +150,9 @@ def fetch_options_contracts(
     """
     client = get_client()
 
-    if expiration_gte is None:
-        expiration_gte = datetime.now(UTC).date()
-    if expiration_lte is None:
-        expiration_lte = datetime.now(UTC).date() + timedelta(days=30)
-
-    results: list[dict] = []
+    expiration_gte, expiration_lte = _default_date_range(expiration_gte, expiration_lte)
 
-    for symbol in SYMBOLS:
+    def _fetch_for_symbol(symbol: str) -> list[dict]:
         try:
             contracts = client.list_options_contracts(
                 underlying_ticker=symbol,
@@ -116,27 +163,24 @@ def fetch_options_contracts(
                 limit=limit_per_symbol,
             )
 
-            count = 0
-            for c in contracts:
-                results.append(
-                    {
-                        "occ_symbol": c.ticker,
-                        "symbol": c.underlying_ticker,
-                        "strike_price": c.strike_price,
-                        "expiration_date": c.expiration_date,
-                        "contract_type": c.contract_type,
-                        "shares_per_contract": c.shares_per_contract,
-                        "exercise_style": c.exercise_style,
-                    }
-                )
-                count += 1
-                if count >= limit_per_symbol:
-                    break
-
-            print(f"  {symbol}: {count} contracts")
+            rows = [
+                dict(zip(_CONTRACT_KEYS, _CONTRACT_VALUES(c), strict=True))
+                for c in itertools.islice(contracts, limit_per_symbol)
+            ]
+
+            print(f"  {symbol}: {len(rows)} contracts")
+            return rows
 
         except Exception as e:
             print(f"  {symbol}: ERROR - {e}")
+            return []
+
+    results: list[dict] = []
+
+    # I/O-bound: fetch all symbols concurrently instead of serially
+    with ThreadPoolExecutor(max_workers=len(SYMBOLS)) as pool:
+        for part in pool.map(_fetch_for_symbol, SYMBOLS):
+            results.extend(part)
 
     print(f"\nTotal: {len(results)} contracts")
     return results
@@ -153,10 +197,11 @@ def get_expiration_dates(symbol: str, days_ahead: int = 60) -> list[date]:
     """
     client = get_client()
 
+    gte, lte = _default_date_range(None, None, days=days_ahead)
     contracts = client.list_options_contracts(
         underlying_ticker=symbol,
-        expiration_date_gte=datetime.now(UTC).date(),
-        expiration_date_lte=datetime.now(UTC).date() + timedelta(days=days_ahead),
+        expiration_date_gte=gte,
+        expiration_date_lte=lte,
         expired=False,
         limit=1000,
     )
@@ -200,12 +245,87 @@ def get_strikes(
     return sorted(strikes)
 
 
+def iter_options_chain(
+    symbol: str,
+    *,
+    min_volume: int = 0,
+    min_open_interest: int = 0,
+    max_spread_pct: float | None = None,
+) -> Iterator[dict]:
+    """
+    Stream filtered options chain rows without materializing a list.
+
+    Same filters and row shape as get_options_chain; use this when
+    composing further filters or only consuming the first N rows.
+    """
+    client = get_client()
+
+    for snap in client.list_snapshot_options_chain(symbol):
+        # Cheap liquidity filters first — most contracts fail these, so skip
+        # the quote math and row building for them entirely
+        day = snap.day or {}
+        volume = getattr(day, "volume", 0) or 0
+        if volume < min_volume:
+            continue
+
+        open_interest = getattr(snap, "open_interest", 0) or 0
+        if open_interest < min_open_interest:
+            continue
+
+        last_quote = snap.last_quote
+        if last_quote is not None:
+            bid, ask = _QUOTE_GET(last_quote)
+            bid = bid or 0
+            ask = ask or 0
+        else:
+            bid = ask = 0
+        mid = (bid + ask) / 2 if bid and ask else 0
+        spread = ask - bid if bid and ask else 0
+        spread_pct = spread / mid if mid > 0 else float("inf")
+
+        if max_spread_pct is not None and spread_pct > max_spread_pct:
+            continue
+
+        details = snap.details
+        if details is not None:
+            d_ticker, d_strike, d_expiration, d_type = _DETAIL_GET(details)
+        else:
+            d_ticker = d_strike = d_expiration = d_type = None
+
+        greeks = snap.greeks
+        if greeks is not None:
+            delta, gamma, theta, vega = _GREEK_GET(greeks)
+        else:
+            delta = gamma = theta = vega = None
+
+        yield {
+            "occ_symbol": d_ticker or snap.ticker,
+            "symbol": symbol,
+            "strike": d_strike,
+            "expiration_date": d_expiration,
+            "type": d_type,
+            "bid": bid,
+            "ask": ask,
+            "mid": round(mid, 2),
+            "spread": round(spread, 2),
+            "spread_pct": round(spread_pct * 100, 2),  # as percentage
+            "volume": volume,
+            "open_interest": open_interest,
+            "iv": getattr(snap, "implied_volatility", None),
+            "delta": delta,
+            "gamma": gamma,
+            "theta": theta,
+            "vega": vega,
+        }
+
+
 def get_options_chain(
     symbol: str,
     *,
     min_volume: int = 0,
     min_open_interest: int = 0,
     max_spread_pct: float | None = None,
+    limit: int | None = None,
 ) -> list[dict]:
     """
     Fetch options chain snapshot with liquidity metrics.
@@ -217,6 +337,7 @@ def get_options_chain(
         min_volume: Filter to contracts with at least this volume
         min_open_interest: Filter to contracts with at least this OI
         max_spread_pct: Filter to contracts with spread <= this % of mid price
+        limit: Stop streaming once this many rows pass the filters
 
     Returns:
         List of dicts with full option snapshot data
@@ -226,61 +347,84 @@ def get_options_chain(
         >>> len(chain)  # Only liquid options
         42
     """
-    client = get_client()
-
-    results = []
-    count = 0
-
-    for snap in client.list_snapshot_options_chain(symbol):
-        count += 1
+    rows = iter_options_chain(
+        symbol,
+        min_volume=min_volume,
+        min_open_interest=min_open_interest,
+        max_spread_pct=max_spread_pct,
+    )
+    if limit is not None:
+        rows = itertools.islice(rows, limit)
 
-        # Extract data safely
-        details = snap.details or {}
-        day = snap.day or {}
-        last_quote = snap.last_quote or {}
-        greeks = snap.greeks or {}
+    results = list(rows)
+    print(f"Fetched {len(results)} contracts passing filters")
+    return results
 
-        bid = getattr(last_quote, "bid", 0) or 0
-        ask = getattr(last_quote, "ask", 0) or 0
-        mid = (bid + ask) / 2 if bid and ask else 0
-        spread = ask - bid if bid and ask else 0
-        spread_pct = spread / mid if mid > 0 else float("inf")
 
-        volume = getattr(day, "volume", 0) or 0
-        open_interest = getattr(snap, "open_interest", 0) or 0
+# Structured dtype for SoA chain snapshots (floats are NaN when missing)
+_CHAIN_DTYPE = np.dtype(
+    [
+        ("occ_symbol", "U32"),
+        ("strike", "f8"),
+        ("bid", "f8"),
+        ("ask", "f8"),
+        ("mid", "f8"),
+        ("spread", "f8"),
+        ("spread_pct", "f8"),
+        ("volume", "i8"),
+        ("open_interest", "i8"),
+        ("iv", "f8"),
+        ("delta", "f8"),
+        ("gamma", "f8"),
+        ("theta", "f8"),
+        ("vega", "f8"),
+    ]
+)
+
+
+def get_options_chain_array(
+    symbol: str,
+    *,
+    min_volume: int = 0,
+    min_open_interest: int = 0,
+    max_spread_pct: float | None = None,
+) -> np.ndarray:
+    """
+    SoA variant of get_options_chain: one NumPy structured array instead of
+    a list of dicts, so downstream filters and math run vectorized.
 
-        # Apply filters
-        if volume < min_volume:
-            continue
-        if open_interest < min_open_interest:
-            continue
-        if max_spread_pct is not None and spread_pct > max_spread_pct:
-            continue
+    Example:
+        >>> chain = get_options_chain_array("NVDA", min_volume=100)
+        >>> liquid = chain[chain["spread_pct"] < 5.0]
+        >>> liquid["mid"].mean()
+    """
+    chain = get_options_chain(
+        symbol,
+        min_volume=min_volume,
+        min_open_interest=min_open_interest,
+        max_spread_pct=max_spread_pct,
+    )
 
-        results.append(
-            {
-                "occ_symbol": getattr(details, "ticker", None) or snap.ticker,
-                "symbol": symbol,
-                "strike": getattr(details, "strike_price", None),
-                "expiration_date": getattr(details, "expiration_date", None),
-                "type": getattr(details, "contract_type", None),
-                "bid": bid,
-                "ask": ask,
-                "mid": round(mid, 2),
-                "spread": round(spread, 2),
-                "spread_pct": round(spread_pct * 100, 2),  # as percentage
-                "volume": volume,
-                "open_interest": open_interest,
-                "iv": getattr(snap, "implied_volatility", None),
-                "delta": getattr(greeks, "delta", None),
-                "gamma": getattr(greeks, "gamma", None),
-                "theta": getattr(greeks, "theta", None),
-                "vega": getattr(greeks, "vega", None),
-            }
+    out = np.empty(len(chain), dtype=_CHAIN_DTYPE)
+    nan = float("nan")
+    for i, row in enumerate(chain):
+        out[i] = (
+            row["occ_symbol"] or "",
+            row["strike"] if row["strike"] is not None else nan,
+            row["bid"],
+            row["ask"],
+            row["mid"],
+            row["spread"],
+            row["spread_pct"],
+            row["volume"],
+            row["open_interest"],
+            row["iv"] if row["iv"] is not None else nan,
+            row["delta"] if row["delta"] is not None else nan,
+            row["gamma"] if row["gamma"] is not None else nan,
+            row["theta"] if row["theta"] is not None else nan,
+            row["vega"] if row["vega"] is not None else nan,
         )
-
-    print(f"Fetched {count} contracts, {len(results)} passed filters")
-    return results
+    return out
 
 
 def get_liquid_options(
@@ -301,7 +445,7 @@ def get_liquid_options(
     Returns:
         List of liquid OCC symbols
     """
-    chain = get_options_chain(
+    chain = iter_options_chain(
         symbol,
         min_volume=min_volume,
         min_open_interest=min_open_interest,
@@ -1,5 +1,6 @@
 """Options WebSocket Listener package."""
 
 from listener.options_listener import OptionsQuoteListener
+from listener.spsc_queue import SPSCQueue
 
-__all__ = ["OptionsQuoteListener"]
+__all__ = ["OptionsQuoteListener", "SPSCQueue"]
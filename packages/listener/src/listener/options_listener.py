@@ -9,8 +9,10 @@ Purpose:
 """
 
 import asyncio
+import functools
 import logging
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
 
 from domain.models import OptionQuoteEvent
@@ -22,8 +24,19 @@ from massive.websocket.models import EquityQuote, Feed, Market, WebSocketMessage
 from store.option_store import OptionStore
 from urllib3 import HTTPResponse
 
+from listener.spsc_queue import SPSCQueue
+
 load_dotenv()
 
+try:
+    # Optional: uvloop's selector beats the stdlib event loop on this
+    # I/O-bound workload; fall through silently when not installed
+    import uvloop  # pyright: ignore[reportMissingImports]
+
+    uvloop.install()
+except ImportError:
+    pass
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(message)s",
@@ -31,6 +44,47 @@ logging.basicConfig(
 logger = logging.getLogger("options_listener")
 
 
+def _fetch_ticker_symbols(
+    client: RESTClient,
+    ticker: str,
+    *,
+    expiration_date_gte: date,
+    expiration_date_lte: date,
+    limit_per_ticker: int,
+) -> list[str]:
+    """Fetch (and paginate) options symbols for a single underlying ticker."""
+    symbols: list[str] = []
+
+    try:
+        result = client.list_options_contracts(
+            underlying_ticker=ticker,
+            expiration_date_gte=expiration_date_gte,
+            expiration_date_lte=expiration_date_lte,
+            expired=False,
+            limit=limit_per_ticker,
+        )
+
+        # list_options_contracts returns HTTPResponse when raw=True,
+        # Iterator[OptionsContract] when raw=False (default)
+        if isinstance(result, HTTPResponse):
+            logger.error("Unexpected raw response for %s", ticker)
+            return symbols
+
+        for contract in result:
+            occ_symbol = getattr(contract, "ticker", None)
+            if occ_symbol:
+                symbols.append(occ_symbol)
+                if len(symbols) >= limit_per_ticker:
+                    break
+
+        logger.info("Fetched %d contracts for %s", len(symbols), ticker)
+
+    except Exception:
+        logger.exception("Failed to fetch contracts for %s", ticker)
+
+    return symbols
+
+
 def fetch_options_symbols(
     api_key: str,
     tickers: Iterable[str],
@@ -42,6 +96,9 @@ def fetch_options_symbols(
     """
     Fetch options contract symbols for given underlying tickers.
 
+    Tickers are fetched concurrently (one thread per ticker, the fetch is
+    I/O-bound), so wall-clock is ~one round trip instead of N.
+
     Args:
         api_key: Massive API key
         tickers: Underlying stock tickers (e.g., ["AAPL", "MSFT"])
@@ -59,48 +116,84 @@ def fetch_options_symbols(
     if expiration_date_lte is None:
         expiration_date_lte = datetime.now(UTC).date() + timedelta(days=30)
 
+    tickers = list(tickers)
     symbols: list[str] = []
 
-    for ticker in tickers:
-        try:
-            result = client.list_options_contracts(
-                underlying_ticker=ticker,
-                expiration_date_gte=expiration_date_gte,
-                expiration_date_lte=expiration_date_lte,
-                expired=False,
-                limit=limit_per_ticker,
+    if tickers:
+        with ThreadPoolExecutor(max_workers=min(len(tickers), 32)) as pool:
+            per_ticker = pool.map(
+                lambda ticker: _fetch_ticker_symbols(
+                    client,
+                    ticker,
+                    expiration_date_gte=expiration_date_gte,
+                    expiration_date_lte=expiration_date_lte,
+                    limit_per_ticker=limit_per_ticker,
+                ),
+                tickers,
             )
+            for ticker_symbols in per_ticker:
+                symbols.extend(ticker_symbols)
 
-            # list_options_contracts returns HTTPResponse when raw=True,
-            # Iterator[OptionsContract] when raw=False (default)
-            if isinstance(result, HTTPResponse):
-                logger.error("Unexpected raw response for %s", ticker)
-                continue
+    logger.info("Total options symbols: %d", len(symbols))
+    return symbols
 
-            count = 0
-            for contract in result:
-                ticker = getattr(contract, "ticker", None)
-                if ticker:
-                    symbols.append(ticker)
-                    count += 1
-                    if count >= limit_per_ticker:
-                        break
 
-            logger.info("Fetched %d contracts for %s", count, ticker)
+async def fetch_options_symbols_async(
+    api_key: str,
+    tickers: Iterable[str],
+    *,
+    expiration_date_gte: date | None = None,
+    expiration_date_lte: date | None = None,
+    limit_per_ticker: int = 100,
+) -> list[str]:
+    """
+    Async variant of fetch_options_symbols for use inside a running event loop.
+
+    Fans the per-ticker fetches out via asyncio.to_thread + gather so the
+    event loop is never blocked by the sync RESTClient.
+    """
+    client = RESTClient(api_key=api_key)
+
+    if expiration_date_gte is None:
+        expiration_date_gte = datetime.now(UTC).date()
+    if expiration_date_lte is None:
+        expiration_date_lte = datetime.now(UTC).date() + timedelta(days=30)
 
-        except Exception:
-            logger.exception("Failed to fetch contracts for %s", ticker)
+    per_ticker = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                _fetch_ticker_symbols,
+                client,
+                ticker,
+                expiration_date_gte=expiration_date_gte,
+                expiration_date_lte=expiration_date_lte,
+                limit_per_ticker=limit_per_ticker,
+            )
+            for ticker in tickers
+        )
+    )
 
+    symbols = [symbol for ticker_symbols in per_ticker for symbol in ticker_symbols]
     logger.info("Total options symbols: %d", len(symbols))
     return symbols
 
 
+@functools.lru_cache(maxsize=4096)
+def _ts_from_millis(timestamp: int) -> datetime:
+    """Convert an epoch-ms timestamp to an aware UTC datetime, memoized.
+
+    Quote bursts share timestamps down to the millisecond, so caching skips
+    the tz conversion in datetime.fromtimestamp for repeated ticks.
+    """
+    return datetime.fromtimestamp(timestamp / 1000, tz=UTC)
+
+
 class OptionsQuoteListener:
     def __init__(
         self,
         *,
         state_store: OptionStore,
-        event_queue: asyncio.Queue[OptionQuoteEvent] | None = None,
+        event_queue: asyncio.Queue[OptionQuoteEvent] | SPSCQueue[OptionQuoteEvent] | None = None,
         option_symbols: Iterable[str] | None = None,
         tickers: Iterable[str] | None = None,
     ):
@@ -109,7 +202,9 @@ class OptionsQuoteListener:
 
         Args:
             state_store: Store to update with latest quotes (required).
-            event_queue: Optional queue to push quote events to.
+            event_queue: Optional queue to push quote events to. Anything
+                        exposing put_nowait/get works; SPSCQueue avoids
+                        asyncio.Queue bookkeeping on the hot path.
             option_symbols: Explicit list of option symbols to subscribe to.
                            If not provided, fetches from tickers.
             tickers: Underlying tickers to fetch options for.
@@ -119,30 +214,49 @@ class OptionsQuoteListener:
         self.state_store = state_store
         self.event_queue = event_queue
 
+        # Defer the contract fetch to run() when only tickers are given, so
+        # __init__ never blocks an already-running event loop on REST calls.
         if option_symbols:
             self.option_symbols = list(option_symbols)
+            self._tickers: list[str] | None = None
         else:
-            tickers = list(tickers) if tickers else SYMBOLS
-            self.option_symbols = fetch_options_symbols(self.api_key, tickers)
+            self.option_symbols = []
+            self._tickers = list(tickers) if tickers else list(SYMBOLS)
 
         self._client: WebSocketClient | None = None
+        self._subs: tuple[str, ...] | None = None
         self._msg_count = 0
 
+        # Reusable scratch event for the no-queue path. apply_quote copies
+        # every field into OptionState and never retains the event, so when
+        # nothing downstream holds a reference we can mutate one event in
+        # place instead of allocating per tick.
+        self._scratch_quote = OptionQuoteEvent(
+            occ_symbol="",
+            bid=0.0,
+            ask=0.0,
+            ts=datetime.fromtimestamp(0, tz=UTC),
+        )
+
         logger.info(
             "Initialized listener | symbols=%d",
             len(self.option_symbols),
         )
 
-    def _build_subscriptions(self) -> list[str]:
-        return [f"Q.{symbol}" for symbol in self.option_symbols]
+    def _build_subscriptions(self) -> tuple[str, ...]:
+        # Memoized: rebuilt lists during reconnect storms are pure waste
+        if self._subs is None:
+            self._subs = tuple(f"Q.{symbol}" for symbol in self.option_symbols)
+        return self._subs
 
     async def _handle_message(self, messages: list[WebSocketMessage]) -> None:
-        for msg in messages:
-            # Options quotes come as EquityQuote messages
-            if not isinstance(msg, EquityQuote):
-                continue
+        batch: list[OptionQuoteEvent] = []
 
-            if msg.event_type != "Q":
+        for msg in messages:
+            # Options quotes come as EquityQuote messages. Exact type check:
+            # the SDK never subclasses its message types, and `type(...) is`
+            # skips the MRO walk isinstance does on every tick.
+            if type(msg) is not EquityQuote or msg.event_type != "Q":
                 continue
 
             self._msg_count += 1
@@ -158,27 +272,51 @@ class OptionsQuoteListener:
                 if timestamp is None:
                     continue
 
-                ts = datetime.fromtimestamp(timestamp / 1000, tz=UTC)
-
-                # Create quote event
-                quote = OptionQuoteEvent(
-                    occ_symbol=symbol,
-                    bid=bid,
-                    ask=ask,
-                    ts=ts,
-                )
-
-                # Let the store handle state building (single-writer)
-                self.state_store.apply_quote(quote)
-
-                # Optionally push to queue for downstream consumers
-                if self.event_queue is not None:
-                    self.event_queue.put_nowait(quote)
+                ts = _ts_from_millis(timestamp)
+
+                if self.event_queue is None:
+                    # No downstream consumer: reuse the scratch event
+                    quote = self._scratch_quote
+                    quote.occ_symbol = symbol
+                    quote.bid = bid
+                    quote.ask = ask
+                    quote.ts = ts
+                    self.state_store.apply_quote(quote)
+                else:
+                    # Queue consumers hold references, so these must be fresh
+                    batch.append(
+                        OptionQuoteEvent(
+                            occ_symbol=symbol,
+                            bid=bid,
+                            ask=ask,
+                            ts=ts,
+                        )
+                    )
 
             except Exception:
                 logger.exception("Failed to process quote: %s", msg)
 
+        # Flush once per websocket delivery: one store call for the whole
+        # batch, then drain to the queue without re-entering the parse loop
+        if batch:
+            self.state_store.apply_quotes(batch)
+            assert self.event_queue is not None
+            put_nowait = self.event_queue.put_nowait
+            dropped = 0
+            for quote in batch:
+                try:
+                    put_nowait(quote)
+                except asyncio.QueueFull:
+                    # A full queue drops the quote, never the batch: the store
+                    # is already updated and consumers are just behind.
+                    dropped += 1
+            if dropped:
+                logger.warning("Event queue full, dropped %d quotes", dropped)
+
     async def run(self) -> None:
+        if not self.option_symbols and self._tickers:
+            self.option_symbols = await fetch_options_symbols_async(self.api_key, self._tickers)
+
         subs = self._build_subscriptions()
         if not subs:
             raise RuntimeError("No option symbols to subscribe to")
@@ -189,7 +327,7 @@ class OptionsQuoteListener:
             api_key=self.api_key,
             feed=Feed.RealTime,
             market=Market.Options,
-            subscriptions=subs,
+            subscriptions=list(subs),
         )
         self._client = client
 
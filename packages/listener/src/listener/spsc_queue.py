@@ -0,0 +1,70 @@
+"""
+Single-producer single-consumer queue for the quote hot path.
+
+asyncio.Queue does bookkeeping (counters, waiter deques) on every
+put_nowait; with exactly one producer (_handle_message) and one consumer
+both on the event loop thread, a fixed-capacity ring buffer indexed by
+monotonically increasing head/tail counters is enough. A push is a single
+list write plus an index bump; the consumer only touches an asyncio.Event
+when the ring is drained.
+
+Duck-type compatible with asyncio.Queue where the listener needs it
+(put_nowait / get / qsize / empty).
+"""
+
+import asyncio
+
+
+class SPSCQueue[T]:
+    """Bounded single-producer single-consumer ring buffer."""
+
+    def __init__(self, capacity: int = 8192):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a positive power of two")
+
+        self._buf: list[T | None] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0  # producer writes at head & mask
+        self._tail = 0  # consumer reads at tail & mask
+        self._data_ready = asyncio.Event()
+
+    def try_push(self, item: T) -> bool:
+        """Push an item; returns False (instead of raising) when full."""
+        head = self._head
+        if head - self._tail > self._mask:
+            return False
+
+        self._buf[head & self._mask] = item
+        self._head = head + 1
+
+        # Only wake the consumer when it may actually be waiting
+        if not self._data_ready.is_set():
+            self._data_ready.set()
+        return True
+
+    def put_nowait(self, item: T) -> None:
+        if not self.try_push(item):
+            raise asyncio.QueueFull
+
+    async def pop(self) -> T:
+        """Wait for and return the next item."""
+        while self._tail == self._head:
+            self._data_ready.clear()
+            await self._data_ready.wait()
+
+        tail = self._tail
+        idx = tail & self._mask
+        item = self._buf[idx]
+        self._buf[idx] = None  # release the ref so the GC can reclaim it
+        self._tail = tail + 1
+        assert item is not None
+        return item
+
+    async def get(self) -> T:
+        return await self.pop()
+
+    def qsize(self) -> int:
+        return self._head - self._tail
+
+    def empty(self) -> bool:
+        return self._head == self._tail
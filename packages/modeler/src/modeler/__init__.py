@@ -1,8 +1,18 @@
 """Modeler package for probability estimation."""
 
 from modeler.confidence_score import compute_confidence
+from modeler.evaluate import SurfaceEvaluation, evaluate_surface
 from modeler.forward_estimator import ForwardEstimate, estimate_forward_put_call_parity
-from modeler.implied_vol import ImpliedVolResult, bs_price_forward, implied_vol_bisect
+from modeler.implied_vol import (
+    ImpliedVolResult,
+    bs_price_forward,
+    bs_price_forward_batch,
+    implied_vol,
+    implied_vol_bisect,
+    implied_vol_bisect_batch,
+    implied_vol_newton_batch,
+)
+from modeler.iv_points import extract_otm_iv_points
 from modeler.models import (
     Model,
     SimpleModel,
@@ -12,7 +22,9 @@ from modeler.models import (
     build_simple_model,
     build_slope_model,
     build_spline_model,
+    build_spline_model_cached,
     build_svi_model,
+    build_svi_model_cached,
 )
 
 __all__ = [
@@ -25,12 +37,21 @@ __all__ = [
     "build_simple_model",
     "build_slope_model",
     "build_spline_model",
+    "build_spline_model_cached",
     "build_svi_model",
+    "build_svi_model_cached",
     # Utilities
     "compute_confidence",
+    "SurfaceEvaluation",
+    "evaluate_surface",
     "ForwardEstimate",
     "estimate_forward_put_call_parity",
     "ImpliedVolResult",
     "bs_price_forward",
+    "bs_price_forward_batch",
+    "implied_vol",
     "implied_vol_bisect",
+    "implied_vol_bisect_batch",
+    "implied_vol_newton_batch",
+    "extract_otm_iv_points",
 ]
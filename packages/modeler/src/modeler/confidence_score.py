@@ -17,6 +17,8 @@ from math import exp
 
 from domain.models import ConfidenceDiagnostics, OptionSurfaceSnapshot, StrikeProbability
 
+from modeler.strikes import nearest_strike_index
+
 
 def compute_confidence(
     *,
@@ -68,29 +70,28 @@ def compute_confidence(
     if call is None or put is None:
         liquidity_score = 0.0
     else:
-        # relative spread vs mid
-        rel_call = call.spread / max(call.mid, 1e-6)
-        rel_put = put.spread / max(put.mid, 1e-6)
-        rel_spread = max(rel_call, rel_put)
+        # Reject on multiplied thresholds first (spread >= limit * mid is
+        # equivalent to spread/mid >= limit) so the common wide-spread case
+        # skips the divisions entirely
+        call_mid = max(call.mid, 1e-6)
+        put_mid = max(put.mid, 1e-6)
 
-        if rel_spread >= max_relative_spread:
+        if call.spread >= max_relative_spread * call_mid or put.spread >= max_relative_spread * put_mid:
             liquidity_score = 0.0
         else:
+            rel_spread = max(call.spread / call_mid, put.spread / put_mid)
             liquidity_score = 1.0 - (rel_spread / max_relative_spread)
 
     # ------------------------------------------------------------
     # 3. Local monotonicity sanity (calls ↓ as strike ↑)
     # ------------------------------------------------------------
 
-    calls = snapshot.calls
-    strikes = [c.strike for c in calls]
-    mids = [c.mid for c in calls]
+    # Column caches on the snapshot — built once per snapshot, not per query
+    strikes = snapshot.call_strikes
+    mids = snapshot.call_mids
 
-    i: int | None = None
-    try:
-        i = min(range(len(strikes)), key=lambda j: abs(strikes[j] - strike))
-    except ValueError:
-        pass
+    # Strikes are sorted ascending (snapshot builder invariant)
+    i = nearest_strike_index(strikes, strike)
 
     if i is None:
         monotonicity_score = 0.0
@@ -10,6 +10,7 @@ Uses multiple strikes and robust aggregation (weighted mean with trimming).
 from dataclasses import dataclass
 from math import isfinite
 
+import numpy as np
 from domain.models import OptionSurfaceSnapshot
 
 
@@ -54,69 +55,89 @@ def estimate_forward_put_call_parity(
     if discount <= 0 or not isfinite(discount):
         raise ValueError("discount must be positive and finite")
 
-    # Build common strike set where both call and put exist
-    strikes = sorted(set(snapshot.call_strikes).intersection(snapshot.put_strikes))
-    if not strikes:
+    # Pair quotes on strikes where both a call and a put exist. Both sides
+    # are strike-sorted (snapshot builder invariant), so a two-pointer merge
+    # pairs them in O(N+M) without building hash maps.
+    all_calls = snapshot.calls
+    all_puts = snapshot.puts
+    calls = []
+    puts = []
+    ci = pi = 0
+    while ci < len(all_calls) and pi < len(all_puts):
+        call_key = round(all_calls[ci].strike * 1000)
+        put_key = round(all_puts[pi].strike * 1000)
+        if call_key == put_key:
+            calls.append(all_calls[ci])
+            puts.append(all_puts[pi])
+            ci += 1
+            pi += 1
+        elif call_key < put_key:
+            ci += 1
+        else:
+            pi += 1
+
+    if not calls:
         return None
 
-    candidates: list[tuple[float, float]] = []  # (F_i, weight)
-
-    for k in strikes:
-        call = snapshot.get_call(k)
-        put = snapshot.get_put(k)
-        if call is None or put is None:
-            continue
-
-        # Basic quote sanity
-        if call.mid <= min_mid or put.mid <= min_mid:
-            continue
-        if call.bid < 0 or call.ask < 0 or call.bid > call.ask:
-            continue
-        if put.bid < 0 or put.ask < 0 or put.bid > put.ask:
-            continue
-
-        if max_spread is not None:
-            if call.spread > max_spread or put.spread > max_spread:
-                continue
+    k = np.array([c.strike for c in calls])
+    c_mid = np.array([c.mid for c in calls])
+    c_bid = np.array([c.bid for c in calls])
+    c_ask = np.array([c.ask for c in calls])
+    c_spread = np.array([c.spread for c in calls])
+    p_mid = np.array([p.mid for p in puts])
+    p_bid = np.array([p.bid for p in puts])
+    p_ask = np.array([p.ask for p in puts])
+    p_spread = np.array([p.spread for p in puts])
+
+    # Basic quote sanity, all strikes at once
+    mask = (
+        (c_mid > min_mid)
+        & (p_mid > min_mid)
+        & (c_bid >= 0)
+        & (c_ask >= 0)
+        & (c_bid <= c_ask)
+        & (p_bid >= 0)
+        & (p_ask >= 0)
+        & (p_bid <= p_ask)
+    )
+    if max_spread is not None:
+        mask &= (c_spread <= max_spread) & (p_spread <= max_spread)
 
-        # Put–call parity forward per strike
-        f_i = k + (call.mid - put.mid) / discount
-        if not isfinite(f_i) or f_i <= 0:
-            continue
+    # Put–call parity forward per strike
+    f = k + (c_mid - p_mid) / discount
+    mask &= np.isfinite(f) & (f > 0)
 
-        # Weight by liquidity (tighter spreads = higher weight)
-        w = 1.0 / max(call.spread + put.spread, 1e-9)
-        candidates.append((f_i, w))
+    # Weight by liquidity (tighter spreads = higher weight)
+    w = 1.0 / np.maximum(c_spread + p_spread, 1e-9)
 
-    if len(candidates) < 3:
+    f = f[mask]
+    w = w[mask]
+    if f.size < 3:
         return None
 
     # Median forward (robust center)
-    fs_sorted = sorted(f for f, _ in candidates)
-    mid_idx = len(fs_sorted) // 2
-    median = fs_sorted[mid_idx] if len(fs_sorted) % 2 == 1 else 0.5 * (fs_sorted[mid_idx - 1] + fs_sorted[mid_idx])
+    median = float(np.median(f))
 
     # Trim outliers around median
-    lo = median * (1.0 - trim_pct)
-    hi = median * (1.0 + trim_pct)
-    trimmed = [(f, w) for f, w in candidates if lo <= f <= hi]
-
-    if len(trimmed) < 3:
+    trim_mask = (f >= median * (1.0 - trim_pct)) & (f <= median * (1.0 + trim_pct))
+    if trim_mask.sum() < 3:
         # If trimming was too aggressive, fall back to untrimmed
-        trimmed = candidates
+        trim_mask = np.ones(f.shape, dtype=bool)
+
+    f_trim = f[trim_mask]
+    w_trim = w[trim_mask]
 
     # Weighted mean on trimmed set
-    w_sum = sum(w for _, w in trimmed)
+    w_sum = float(w_trim.sum())
     if w_sum <= 0:
         return None
 
-    forward = sum(f * w for f, w in trimmed) / w_sum
-    f_vals = [f for f, _ in trimmed]
+    forward = float((f_trim * w_trim).sum() / w_sum)
 
     return ForwardEstimate(
         forward=forward,
-        n_used=len(trimmed),
+        n_used=int(f_trim.size),
         median=median,
-        min_f=min(f_vals),
-        max_f=max(f_vals),
+        min_f=float(f_trim.min()),
+        max_f=float(f_trim.max()),
     )
@@ -16,11 +16,24 @@ Note: US equity options are American; this is a European approximation.
 """
 
 from dataclasses import dataclass
-from math import erf, isfinite, log, sqrt
+from math import erf, exp, isfinite, log, pi, sqrt
+
+import numpy as np
+from scipy.special import ndtr
+
+# Precomputed so each CDF evaluation is one multiply + one C-level erf call
+_INV_SQRT2 = 1.0 / sqrt(2.0)
 
 
 def _norm_cdf(x: float) -> float:
-    return 0.5 * (1.0 + erf(x / sqrt(2.0)))
+    return 0.5 * (1.0 + erf(x * _INV_SQRT2))
+
+
+_INV_SQRT2PI = 1.0 / sqrt(2.0 * pi)
+
+
+def _norm_pdf(x: float) -> float:
+    return exp(-0.5 * x * x) * _INV_SQRT2PI
 
 
 def bs_price_forward(
@@ -50,6 +63,22 @@ def bs_price_forward(
     raise ValueError("option_type must be 'call' or 'put'")
 
 
+def _bs_call(F: float, K: float, T: float, sigma: float, discount: float) -> float:
+    """Call price with inputs pre-validated (positive F/K/T/sigma/discount)."""
+    vol_sqrt = sigma * sqrt(T)
+    d1 = (log(F / K) + 0.5 * sigma * sigma * T) / vol_sqrt
+    d2 = d1 - vol_sqrt
+    return discount * (F * _norm_cdf(d1) - K * _norm_cdf(d2))
+
+
+def _bs_put(F: float, K: float, T: float, sigma: float, discount: float) -> float:
+    """Put price with inputs pre-validated (positive F/K/T/sigma/discount)."""
+    vol_sqrt = sigma * sqrt(T)
+    d1 = (log(F / K) + 0.5 * sigma * sigma * T) / vol_sqrt
+    d2 = d1 - vol_sqrt
+    return discount * (K * _norm_cdf(-d2) - F * _norm_cdf(-d1))
+
+
 def _no_arb_bounds_forward(
     *,
     option_type: str,
@@ -86,10 +115,15 @@ def implied_vol_bisect(
     vol_high: float = 5.0,
     tol: float = 1e-8,
     max_iter: int = 100,
+    sigma_hint: float | None = None,
 ) -> ImpliedVolResult | None:
     """
     Invert Black–Scholes implied vol using bisection.
 
+    sigma_hint warm-starts the bracket: implied vol varies smoothly across a
+    chain, so callers iterating over strikes can pass the previous strike's
+    sigma and typically halve the iteration count.
+
     Returns None if inputs are invalid or price is outside no-arbitrage bounds.
     """
 
@@ -108,12 +142,27 @@ def implied_vol_bisect(
     if abs(price - lb) <= 1e-12:
         return ImpliedVolResult(sigma=vol_low, iterations=0, price_fit=lb)
 
+    # Bind the specialized pricer once — no option_type branch per iteration
+    pricer = _bs_call if option_type == "call" else _bs_put
+
     lo = vol_low
     hi = vol_high
 
+    # Warm start: shrink the bracket to one side of the hint (accept the hint
+    # outright when it already prices within tolerance)
+    if sigma_hint is not None and vol_low < sigma_hint < vol_high:
+        p_hint = pricer(F, K, T, sigma_hint, discount)
+        if isfinite(p_hint):
+            if abs(p_hint - price) <= 5.0 * tol:
+                return ImpliedVolResult(sigma=sigma_hint, iterations=0, price_fit=p_hint)
+            if p_hint < price:
+                lo = sigma_hint
+            else:
+                hi = sigma_hint
+
     # Ensure bracket: price(lo) <= target <= price(hi)
-    p_lo = bs_price_forward(option_type=option_type, F=F, K=K, T=T, sigma=lo, discount=discount)
-    p_hi = bs_price_forward(option_type=option_type, F=F, K=K, T=T, sigma=hi, discount=discount)
+    p_lo = pricer(F, K, T, lo, discount)
+    p_hi = pricer(F, K, T, hi, discount)
 
     if not (isfinite(p_lo) and isfinite(p_hi)):
         return None
@@ -124,7 +173,7 @@ def implied_vol_bisect(
             hi *= 1.5
             if hi > 10.0:
                 break
-            p_hi = bs_price_forward(option_type=option_type, F=F, K=K, T=T, sigma=hi, discount=discount)
+            p_hi = pricer(F, K, T, hi, discount)
             if p_hi >= price:
                 break
 
@@ -138,7 +187,7 @@ def implied_vol_bisect(
     while it < max_iter:
         it += 1
         mid = 0.5 * (lo + hi)
-        p_mid = bs_price_forward(option_type=option_type, F=F, K=K, T=T, sigma=mid, discount=discount)
+        p_mid = pricer(F, K, T, mid, discount)
 
         if not isfinite(p_mid):
             return None
@@ -153,3 +202,259 @@ def implied_vol_bisect(
             hi = mid
 
     return ImpliedVolResult(sigma=mid, iterations=it, price_fit=p_mid)
+
+
+def bs_price_forward_batch(
+    *,
+    is_call: np.ndarray,  # bool array: True for calls
+    F: float,  # forward price
+    K: np.ndarray,  # strikes
+    T: float,  # time to expiry (years)
+    sigma: np.ndarray,
+    discount: float = 1.0,
+) -> np.ndarray:
+    """Vectorized bs_price_forward across strike/vol arrays (NaN where invalid)."""
+    if F <= 0 or T <= 0 or discount <= 0:
+        return np.full(np.asarray(K, dtype=np.float64).shape, np.nan)
+
+    K = np.asarray(K, dtype=np.float64)
+    sigma = np.asarray(sigma, dtype=np.float64)
+
+    valid = (K > 0) & (sigma > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vol_sqrt = sigma * sqrt(T)
+        d1 = (np.log(F / K) + 0.5 * sigma * sigma * T) / vol_sqrt
+        d2 = d1 - vol_sqrt
+        call = discount * (F * ndtr(d1) - K * ndtr(d2))
+        put = discount * (K * ndtr(-d2) - F * ndtr(-d1))
+
+    return np.where(valid, np.where(is_call, call, put), np.nan)
+
+
+def implied_vol_bisect_batch(
+    *,
+    is_call: np.ndarray,  # bool array: True for calls
+    prices: np.ndarray,  # option mid prices
+    F: float,  # forward price
+    K: np.ndarray,  # strikes
+    T: float,  # time to expiry (years)
+    discount: float = 1.0,
+    vol_low: float = 1e-6,
+    vol_high: float = 5.0,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    Vectorized bisection: invert implied vols for whole strike arrays at once.
+
+    Each iteration prices every unconverged strike in one NumPy pass instead
+    of per-strike Python loops. Returns NaN where inputs are invalid or the
+    price violates no-arbitrage bounds.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    K = np.asarray(K, dtype=np.float64)
+
+    if F <= 0 or T <= 0 or discount <= 0:
+        return np.full(prices.shape, np.nan)
+
+    lb = discount * np.where(is_call, np.maximum(F - K, 0.0), np.maximum(K - F, 0.0))
+    ub = discount * np.where(is_call, F, K)
+    valid = (K > 0) & (prices > 0) & (prices >= lb - 1e-10) & (prices <= ub + 1e-10)
+
+    lo = np.full(prices.shape, vol_low)
+    hi = np.full(prices.shape, vol_high)
+    sigma = 0.5 * (lo + hi)
+
+    for _ in range(max_iter):
+        p = bs_price_forward_batch(is_call=is_call, F=F, K=K, T=T, sigma=sigma, discount=discount)
+        diff = p - prices
+        done = ~valid | (np.abs(diff) <= tol)
+        if done.all():
+            break
+        lo = np.where(diff < 0, sigma, lo)
+        hi = np.where(diff >= 0, sigma, hi)
+        sigma = 0.5 * (lo + hi)
+
+    return np.where(valid, sigma, np.nan)
+
+
+def _rational_vol_seed(
+    *,
+    is_call: np.ndarray,
+    prices: np.ndarray,
+    F: float,
+    K: np.ndarray,
+    T: float,
+    discount: float,
+) -> np.ndarray:
+    """
+    Rational (Corrado–Miller) initial guess for implied vol.
+
+    Unlike the ATM-only Brenner–Subrahmanyam seed, this accounts for
+    moneyness, so Newton starts much closer to the root for OTM strikes.
+    Puts are converted to calls via forward parity first. Falls back to the
+    ATM seed where the rational form leaves its valid domain.
+    """
+    # Undiscounted call price: C' = C/D, with puts mapped via C - P = D*(F - K)
+    c = prices / discount + np.where(is_call, 0.0, F - K)
+
+    half_intrinsic = 0.5 * (F - K)
+    excess = c - half_intrinsic
+    inner = excess * excess - (F - K) * (F - K) / pi
+
+    with np.errstate(invalid="ignore"):
+        cm = sqrt(2.0 * pi / T) / (F + K) * (excess + np.sqrt(np.maximum(inner, 0.0)))
+
+    atm = sqrt(2.0 * pi / T) * c / F
+    seed = np.where(np.isfinite(cm) & (cm > 0), cm, atm)
+    return np.clip(seed, 0.05, 2.0)
+
+
+def implied_vol_newton_batch(
+    *,
+    is_call: np.ndarray,  # bool array: True for calls
+    prices: np.ndarray,  # option mid prices
+    F: float,  # forward price
+    K: np.ndarray,  # strikes
+    T: float,  # time to expiry (years)
+    discount: float = 1.0,
+    vol_low: float = 1e-6,
+    vol_high: float = 5.0,
+    tol: float = 1e-8,
+    max_iter: int = 20,
+) -> np.ndarray:
+    """
+    Vectorized bracketed Newton: invert a whole strike slice per iteration.
+
+    Each step prices and differentiates every strike in a handful of ufunc
+    calls; elements whose Newton update leaves the bracket (or whose vega
+    vanishes) fall back to the bisection midpoint, so convergence is as
+    robust as implied_vol_bisect_batch but typically 5-10x fewer iterations.
+    Returns NaN where inputs are invalid or violate no-arbitrage bounds.
+
+    Deliberately single-threaded: run_models already parallelizes across
+    expiries, and one expiry's slice is too small to amortize a second
+    layer of strike-level parallelism.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    K = np.asarray(K, dtype=np.float64)
+
+    if F <= 0 or T <= 0 or discount <= 0:
+        return np.full(prices.shape, np.nan)
+
+    lb = discount * np.where(is_call, np.maximum(F - K, 0.0), np.maximum(K - F, 0.0))
+    ub = discount * np.where(is_call, F, K)
+    valid = (K > 0) & (prices > 0) & (prices >= lb - 1e-10) & (prices <= ub + 1e-10)
+
+    lo = np.full(prices.shape, vol_low)
+    hi = np.full(prices.shape, vol_high)
+
+    # Moneyness-aware rational seed, clamped into the bracket
+    sigma = _rational_vol_seed(is_call=is_call, prices=prices, F=F, K=K, T=T, discount=discount)
+    sqrt_T = sqrt(T)
+
+    for _ in range(max_iter):
+        p = bs_price_forward_batch(is_call=is_call, F=F, K=K, T=T, sigma=sigma, discount=discount)
+        diff = p - prices
+        done = ~valid | (np.abs(diff) <= tol)
+        if done.all():
+            break
+
+        # Maintain the bisection bracket around the root
+        lo = np.where(done | (diff >= 0), lo, sigma)
+        hi = np.where(done | (diff < 0), hi, sigma)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d1 = (np.log(F / K) + 0.5 * sigma * sigma * T) / (sigma * sqrt_T)
+            vega = discount * F * np.exp(-0.5 * d1 * d1) * _INV_SQRT2PI * sqrt_T
+            step = sigma - diff / vega
+
+        # Newton where it stays bracketed; bisection midpoint otherwise
+        bad = ~np.isfinite(step) | (step <= lo) | (step >= hi) | (vega <= 1e-12)
+        sigma = np.where(done, sigma, np.where(bad, 0.5 * (lo + hi), step))
+
+    return np.where(valid, sigma, np.nan)
+
+
+def implied_vol(
+    *,
+    option_type: str,  # "call" or "put"
+    price: float,  # option mid price
+    F: float,  # forward price
+    K: float,  # strike
+    T: float,  # time to expiry (years)
+    discount: float = 1.0,
+    tol: float = 1e-8,
+    max_iter: int = 20,
+) -> ImpliedVolResult | None:
+    """
+    Invert Black–Scholes implied vol via Newton's method with analytic vega.
+
+    Converges in a handful of iterations (quadratic) instead of bisection's
+    ~30–50 evaluations. Falls back to implied_vol_bisect if the iteration
+    leaves the valid vol bracket or stalls.
+
+    Returns None if inputs are invalid or price is outside no-arbitrage bounds.
+    """
+
+    if not (isfinite(price) and isfinite(F) and isfinite(K) and isfinite(T) and isfinite(discount)):
+        return None
+    if price <= 0 or F <= 0 or K <= 0 or T <= 0 or discount <= 0:
+        return None
+
+    lb, ub = _no_arb_bounds_forward(option_type=option_type, F=F, K=K, discount=discount)
+
+    # Allow small numerical slack
+    if price < lb - 1e-10 or price > ub + 1e-10:
+        return None
+
+    # Handle near-intrinsic: vol ~ 0
+    if abs(price - lb) <= 1e-12:
+        return ImpliedVolResult(sigma=1e-6, iterations=0, price_fit=lb)
+
+    vol_low = 1e-6
+    vol_high = 5.0
+
+    # Bind the specialized pricer once — no option_type branch per iteration
+    pricer = _bs_call if option_type == "call" else _bs_put
+
+    # ATM-forward initial guess (Brenner–Subrahmanyam), clamped into the bracket
+    sigma = sqrt(2.0 * pi / T) * (price / discount) / F
+    sigma = min(max(sigma, 0.05), 2.0)
+
+    sqrt_T = sqrt(T)
+
+    for it in range(1, max_iter + 1):
+        p = pricer(F, K, T, sigma, discount)
+        if not isfinite(p):
+            break
+
+        diff = p - price
+        if abs(diff) <= tol:
+            return ImpliedVolResult(sigma=sigma, iterations=it, price_fit=p)
+
+        vol_sqrt = sigma * sqrt_T
+        d1 = (log(F / K) + 0.5 * sigma * sigma * T) / vol_sqrt
+        vega = discount * F * _norm_pdf(d1) * sqrt_T
+        if vega <= 1e-12:
+            break
+
+        sigma_next = sigma - diff / vega
+        if not (vol_low <= sigma_next <= vol_high):
+            break
+
+        if abs(sigma_next - sigma) <= 1e-14:
+            return ImpliedVolResult(sigma=sigma_next, iterations=it, price_fit=p)
+
+        sigma = sigma_next
+
+    # Newton left the bracket or ran out of iterations — bisect instead
+    return implied_vol_bisect(
+        option_type=option_type,
+        price=price,
+        F=F,
+        K=K,
+        T=T,
+        discount=discount,
+        tol=tol,
+    )
@@ -0,0 +1,70 @@
+"""
+Shared OTM implied-vol point extraction for the smile models.
+
+SVI and spline fits consume the same inputs — (k, w, weights) where
+k = ln(K/F) and w = sigma^2 * T for the OTM option at each strike — so the
+extraction lives here and runs once per expiry instead of once per model.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from domain.models import OptionSurfaceSnapshot
+
+from modeler.implied_vol import implied_vol_newton_batch
+
+
+def extract_otm_iv_points(
+    *,
+    snapshot: OptionSurfaceSnapshot,
+    F: float,
+    T: float,
+    discount: float,
+    max_spread: float | None,
+    min_mid: float = 1e-6,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    Returns arrays (k, w, weights) where:
+      k = ln(K/F)
+      w = sigma^2 * T
+    Uses OTM option per strike:
+      - put if K < F
+      - call if K >= F
+    """
+    # Strike-paired SoA columns cached on the snapshot; the whole OTM slice
+    # then inverts in one vectorized Newton solve.
+    Ks, call_mid, call_spread, put_mid, put_spread = snapshot.paired_columns
+
+    if Ks.size < 8:
+        return None
+
+    # OTM side: puts below the forward, calls at or above it
+    is_call = Ks >= F
+    price = np.where(is_call, call_mid, put_mid)
+    spread = np.where(is_call, call_spread, put_spread)
+
+    ok = (price > min_mid) & (spread >= 0)
+    if max_spread is not None:
+        ok &= (call_spread <= max_spread) & (put_spread <= max_spread)
+
+    sigma = implied_vol_newton_batch(
+        is_call=is_call,
+        prices=price,
+        F=F,
+        K=Ks,
+        T=T,
+        discount=discount,
+    )
+    w = sigma * sigma * T
+    ok &= np.isfinite(w) & (w > 0)
+
+    if int(ok.sum()) < 8:
+        return None
+
+    # Ks ascending implies k ascending (required for spline stability)
+    k = np.log(Ks[ok] / F)
+
+    # weight tighter spreads higher (in IV-space, spread is a proxy)
+    weights = 1.0 / np.maximum(spread[ok], 1e-6)
+
+    return k, w[ok], weights
@@ -13,8 +13,8 @@ from typing import Protocol
 
 from modeler.models.simple import SimpleModel, build_simple_model
 from modeler.models.slope import SlopeModel, build_slope_model
-from modeler.models.spline import SplineModel, build_spline_model
-from modeler.models.svi import SVIModel, build_svi_model
+from modeler.models.spline import SplineModel, build_spline_model, build_spline_model_cached
+from modeler.models.svi import SVIModel, build_svi_model, build_svi_model_cached
 
 
 class Model(Protocol):
@@ -34,5 +34,7 @@ __all__ = [
     "build_simple_model",
     "build_slope_model",
     "build_spline_model",
+    "build_spline_model_cached",
     "build_svi_model",
+    "build_svi_model_cached",
 ]
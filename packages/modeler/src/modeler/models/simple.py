@@ -5,8 +5,9 @@ Estimates P(S_T > K) using call/put mid prices
 at the same strike.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
 from domain.models import OptionSurfaceSnapshot, StrikeProbability
 
 
@@ -17,16 +18,58 @@ class SimpleModel:
     snapshot: OptionSurfaceSnapshot
     max_spread: float | None = None
 
+    # Lazy SoA cache over strikes with both a call and a put quote, so batch
+    # queries run as vectorized NumPy ops instead of per-strike dict lookups.
+    _keys: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _call_mid: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _put_mid: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _pair_spread: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        keys = self._keys
+        if keys is None:
+            # Strike-paired SoA columns cached on the snapshot; key strikes in
+            # integer thousandths (OCC precision) for exact matching
+            strikes, call_mid, call_spread, put_mid, put_spread = self.snapshot.paired_columns
+            keys = np.rint(strikes * 1000).astype(np.int64)
+            pair_spread = np.maximum(call_spread, put_spread)
+
+            object.__setattr__(self, "_keys", keys)
+            object.__setattr__(self, "_call_mid", call_mid)
+            object.__setattr__(self, "_put_mid", put_mid)
+            object.__setattr__(self, "_pair_spread", pair_spread)
+            return keys, call_mid, put_mid, pair_spread
+
+        assert self._call_mid is not None and self._put_mid is not None and self._pair_spread is not None
+        return keys, self._call_mid, self._put_mid, self._pair_spread
+
     def prob_above(self, K: float) -> float:
         """Return P(S_T > K) for strike K."""
-        result = estimate_probability_simple(
-            snapshot=self.snapshot,
-            strike=K,
-            max_spread=self.max_spread,
-        )
-        if result is None:
-            return float("nan")
-        return result.prob_above
+        return float(self.prob_above_batch(np.array([K]))[0])
+
+    def prob_above_batch(self, Ks: np.ndarray) -> np.ndarray:
+        """Vectorized P(S_T > K) for an array of strikes (NaN where unavailable)."""
+        keys, call_mid, put_mid, pair_spread = self._arrays()
+
+        Ks = np.asarray(Ks, dtype=np.float64)
+        if keys.size == 0:
+            return np.full(Ks.shape, np.nan)
+
+        q = np.rint(Ks * 1000).astype(np.int64)
+        idx = np.minimum(np.searchsorted(keys, q), keys.size - 1)
+
+        c = call_mid[idx]
+        p = put_mid[idx]
+        denom = c + p
+
+        ok = (keys[idx] == q) & (c > 0) & (p > 0) & (denom > 0)
+        if self.max_spread is not None:
+            ok &= pair_spread[idx] <= self.max_spread
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = np.where(ok, c / denom, np.nan)
+        np.clip(out, 0.0, 1.0, out=out)  # in place: no extra allocation
+        return out
 
 
 def build_simple_model(
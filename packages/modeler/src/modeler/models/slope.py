@@ -8,10 +8,13 @@ where dC/dK is approximated using finite differences
 on call mid prices.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
 from domain.models import OptionSurfaceSnapshot, StrikeProbability
 
+from modeler.strikes import nearest_strike_index
+
 
 @dataclass(frozen=True, slots=True)
 class SlopeModel:
@@ -22,18 +25,61 @@ class SlopeModel:
     discount: float = 1.0
     max_spread: float | None = None
 
+    # Lazy SoA cache: strikes plus the centered-difference probability at
+    # every interior strike, computed in one vectorized pass.
+    _strikes: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+    _probs: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        strikes = self._strikes
+        if strikes is None:
+            strikes, mids, spreads = self.snapshot.call_columns
+
+            w = self.window
+            n = strikes.size
+            probs = np.full(n, np.nan)
+
+            if n >= 2 * w + 1:
+                dk = strikes[2 * w :] - strikes[: -2 * w]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    interior = (mids[2 * w :] - mids[: -2 * w]) / dk
+                interior /= -self.discount
+                np.clip(interior, 0.0, 1.0, out=interior)  # in place: no extra allocation
+                interior = np.where(dk != 0, interior, np.nan)
+
+                if self.max_spread is not None:
+                    windows = np.lib.stride_tricks.sliding_window_view(spreads, 2 * w + 1)
+                    interior = np.where(windows.max(axis=1) <= self.max_spread, interior, np.nan)
+
+                probs[w : n - w] = interior
+
+            object.__setattr__(self, "_strikes", strikes)
+            object.__setattr__(self, "_probs", probs)
+            return strikes, probs
+
+        assert self._probs is not None
+        return strikes, self._probs
+
     def prob_above(self, K: float) -> float:
         """Return P(S_T > K) for strike K."""
-        result = estimate_probability_slope(
-            snapshot=self.snapshot,
-            strike=K,
-            window=self.window,
-            discount=self.discount,
-            max_spread=self.max_spread,
-        )
-        if result is None:
-            return float("nan")
-        return result.prob_above
+        return float(self.prob_above_batch(np.array([K]))[0])
+
+    def prob_above_batch(self, Ks: np.ndarray) -> np.ndarray:
+        """Vectorized P(S_T > K) for an array of strikes (NaN where unavailable)."""
+        strikes, probs = self._arrays()
+
+        Ks = np.asarray(Ks, dtype=np.float64)
+        n = strikes.size
+        if n == 0:
+            return np.full(Ks.shape, np.nan)
+
+        # Vectorized nearest-strike index (ties to the lower strike)
+        pos = np.searchsorted(strikes, Ks)
+        left = np.clip(pos - 1, 0, n - 1)
+        right = np.clip(pos, 0, n - 1)
+        idx = np.where(strikes[right] - Ks < Ks - strikes[left], right, left)
+
+        return probs[idx]
 
 
 def build_slope_model(
@@ -87,40 +133,30 @@ def estimate_probability_slope(
     StrikeProbability or None if insufficient data
     """
 
-    calls = snapshot.calls
-    if len(calls) < 2 * window + 1:
+    # Column caches on the snapshot — built once per snapshot, not per query
+    strikes, mids, spreads = snapshot.call_columns
+    if strikes.size < 2 * window + 1:
         return None
 
-    # Extract strikes and mids
-    strikes = [c.strike for c in calls]
-    mids = [c.mid for c in calls]
-    spreads = [c.spread for c in calls]
-
-    # Find index closest to target strike
-    try:
-        i = min(
-            range(len(strikes)),
-            key=lambda j: abs(strikes[j] - strike),
-        )
-    except ValueError:
+    # Find index closest to target strike (strikes are sorted ascending)
+    i = nearest_strike_index(strikes, strike)
+    if i is None:
         return None
 
     left = i - window
     right = i + window
 
-    if left < 0 or right >= len(strikes):
+    if left < 0 or right >= strikes.size:
         return None
 
-    # Optional liquidity filter
-    if max_spread is not None:
-        for j in range(left, right + 1):
-            if spreads[j] > max_spread:
-                return None
+    # Optional liquidity filter: one vectorized max over the window slab
+    if max_spread is not None and float(spreads[left : right + 1].max()) > max_spread:
+        return None
 
-    k_left = strikes[left]
-    k_right = strikes[right]
-    c_left = mids[left]
-    c_right = mids[right]
+    k_left = float(strikes[left])
+    k_right = float(strikes[right])
+    c_left = float(mids[left])
+    c_right = float(mids[right])
 
     if k_right == k_left:
         return None
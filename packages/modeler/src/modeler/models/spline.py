@@ -17,20 +17,17 @@ Notes:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import isfinite, log, sqrt
+from functools import lru_cache
+from math import log, sqrt
+from typing import cast
 
 import numpy as np
 from domain.models import OptionSurfaceSnapshot
-from scipy.interpolate import UnivariateSpline
+from scipy.interpolate import splev, splrep
+from scipy.special import ndtr
 
 from modeler.forward_estimator import estimate_forward_put_call_parity
-from modeler.implied_vol import implied_vol_bisect
-
-
-def _norm_cdf(x: float) -> float:
-    from math import erf
-
-    return 0.5 * (1.0 + erf(x / sqrt(2.0)))
+from modeler.iv_points import extract_otm_iv_points
 
 
 def _bs_prob_above(*, F: float, K: float, T: float, sigma: float) -> float:
@@ -40,7 +37,7 @@ def _bs_prob_above(*, F: float, K: float, T: float, sigma: float) -> float:
     vol_sqrt = sigma * sqrt(T)
     d2 = (log(F / K) + 0.5 * sigma * sigma * T) / vol_sqrt
     # P(S_T > K) = N(d2) in risk-neutral measure
-    return _norm_cdf(d2)
+    return float(ndtr(d2))
 
 
 @dataclass(frozen=True, slots=True)
@@ -52,7 +49,10 @@ class SplineFitResult:
 @dataclass(frozen=True, slots=True)
 class SplineModel:
     fit: SplineFitResult
-    spline_w: UnivariateSpline
+    # FITPACK (knots, coefficients, degree) of the fitted w(k) spline; kept
+    # instead of the UnivariateSpline object so evaluation goes straight to
+    # splev without the wrapper's per-call dispatch.
+    tck: tuple[np.ndarray, np.ndarray, int]
     T: float
     discount: float
     k_min: float
@@ -65,90 +65,31 @@ class SplineModel:
         # mild extrapolation control: clamp to observed range
         k = min(max(k, self.k_min), self.k_max)
 
-        result = np.asarray(self.spline_w(k))
-        w: float = float(result.item()) if result.ndim == 0 else float(result[0])
         # enforce positivity
-        return max(w, 1e-12)
+        return max(float(np.asarray(splev(k, self.tck))), 1e-12)
 
     def implied_vol(self, K: float) -> float:
         w = self.total_variance(K)
         return sqrt(w / self.T)
 
     def prob_above(self, K: float) -> float:
-        sigma = self.implied_vol(K)
-        p = _bs_prob_above(F=self.fit.forward, K=K, T=self.T, sigma=sigma)
-        return max(0.0, min(1.0, float(p)))
-
-
-def _extract_otm_iv_points(
-    *,
-    snapshot: OptionSurfaceSnapshot,
-    F: float,
-    T: float,
-    discount: float,
-    max_spread: float | None,
-    min_mid: float = 1e-6,
-) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
-    strikes = sorted(set(snapshot.call_strikes).intersection(snapshot.put_strikes))
-    if len(strikes) < 8:
-        return None
-
-    ks: list[float] = []
-    ws: list[float] = []
-    weights: list[float] = []
-
-    for K in strikes:
-        call = snapshot.get_call(K)
-        put = snapshot.get_put(K)
-        if call is None or put is None:
-            continue
-
-        if max_spread is not None and (call.spread > max_spread or put.spread > max_spread):
-            continue
-
-        if K < F:
-            opt_type = "put"
-            price = put.mid
-            spread = put.spread
-        else:
-            opt_type = "call"
-            price = call.mid
-            spread = call.spread
-
-        if price <= min_mid or spread < 0:
-            continue
-
-        iv = implied_vol_bisect(
-            option_type=opt_type,
-            price=price,
-            F=F,
-            K=K,
-            T=T,
-            discount=discount,
-        )
-        if iv is None:
-            continue
-
-        sigma = iv.sigma
-        w = sigma * sigma * T
-        if not isfinite(w) or w <= 0:
-            continue
-
-        k = log(K / F)
-        ks.append(k)
-        ws.append(w)
-        weights.append(1.0 / max(spread, 1e-6))
+        return float(self.prob_above_batch(np.array([K]))[0])
 
-    if len(ks) < 8:
-        return None
+    def prob_above_batch(self, Ks: np.ndarray) -> np.ndarray:
+        """Vectorized P(S_T > K): one spline evaluation for the whole grid."""
+        Ks = np.asarray(Ks, dtype=np.float64)
+        F = self.fit.forward
 
-    k_arr = np.array(ks)
-    w_arr = np.array(ws)
-    wgt = np.array(weights)
+        # mild extrapolation control: clamp to observed range
+        k = np.clip(np.log(Ks / F), self.k_min, self.k_max)
+        w = np.maximum(splev(k, self.tck), 1e-12)
+        sigma = np.sqrt(w / self.T)
 
-    # sort by k (required for spline stability)
-    idx = np.argsort(k_arr)
-    return k_arr[idx], w_arr[idx], wgt[idx]
+        vol_sqrt = sigma * sqrt(self.T)
+        d = (np.log(F / Ks) + 0.5 * sigma * sigma * self.T) / vol_sqrt
+        out = ndtr(d)
+        np.clip(out, 0.0, 1.0, out=out)
+        return out
 
 
 def build_spline_model(
@@ -159,33 +100,47 @@ def build_spline_model(
     max_spread: float | None = None,
     trim_pct: float = 0.02,
     smoothing: float | None = None,  # if None, auto based on noise
+    precomputed_forward: float | None = None,
+    precomputed_points: tuple[np.ndarray, np.ndarray, np.ndarray, float] | None = None,
 ) -> SplineModel | None:
     """
     Fit a smoothing spline to total variance w(k).
     Returns None if insufficient data.
-    """
 
-    f_est = estimate_forward_put_call_parity(
-        snapshot=snapshot,
-        discount=discount,
-        max_spread=max_spread,
-        trim_pct=trim_pct,
-    )
-    if f_est is None:
-        return None
-    F = f_est.forward
+    precomputed_points is an optional (k, w, weights, F) tuple from
+    extract_otm_iv_points; when supplied, forward estimation and IV
+    extraction are skipped so callers fitting several models per expiry
+    pay for them once. precomputed_forward skips just the put-call parity
+    regression for callers that already estimated the forward.
+    """
 
-    pts = _extract_otm_iv_points(
-        snapshot=snapshot,
-        F=F,
-        T=T,
-        discount=discount,
-        max_spread=max_spread,
-    )
-    if pts is None:
-        return None
+    if precomputed_points is not None:
+        k, w, weights, F = precomputed_points
+    else:
+        if precomputed_forward is not None:
+            F = precomputed_forward
+        else:
+            f_est = estimate_forward_put_call_parity(
+                snapshot=snapshot,
+                discount=discount,
+                max_spread=max_spread,
+                trim_pct=trim_pct,
+            )
+            if f_est is None:
+                return None
+            F = f_est.forward
+
+        pts = extract_otm_iv_points(
+            snapshot=snapshot,
+            F=F,
+            T=T,
+            discount=discount,
+            max_spread=max_spread,
+        )
+        if pts is None:
+            return None
 
-    k, w, weights = pts
+        k, w, weights = pts
 
     # Choose smoothing if not provided: proportional to noise and point count
     # Larger smoothing => smoother curve; smaller => closer fit
@@ -194,14 +149,45 @@ def build_spline_model(
         w_std = float(np.std(w))
         smoothing = max(1e-8, 0.5 * w_std * len(w))
 
-    # UnivariateSpline uses weights as 1/sigma_y; we already use liquidity proxy
-    spline = UnivariateSpline(k, w, w=weights, s=float(smoothing), k=3)
+    # splrep uses weights as 1/sigma_y (same FITPACK curfit routine as
+    # UnivariateSpline) and hands back the tck directly — no reaching into
+    # the wrapper's private state. k from extract_otm_iv_points is strictly
+    # increasing, as splrep requires. The cast narrows splrep's union return
+    # (without full_output it is always the 3-tuple).
+    tck = cast(tuple[np.ndarray, np.ndarray, int], splrep(k, w, w=weights, s=float(smoothing), k=3))
 
     return SplineModel(
         fit=SplineFitResult(forward=F, n_points=int(len(k))),
-        spline_w=spline,
+        tck=tck,
         T=T,
         discount=discount,
         k_min=float(k.min()),
         k_max=float(k.max()),
     )
+
+
+@lru_cache(maxsize=128)
+def _build_spline_cached(
+    snapshot: OptionSurfaceSnapshot,
+    T: float,
+    discount: float,
+    max_spread: float | None,
+) -> SplineModel | None:
+    return build_spline_model(snapshot=snapshot, T=T, discount=discount, max_spread=max_spread)
+
+
+def build_spline_model_cached(
+    *,
+    snapshot: OptionSurfaceSnapshot,
+    T: float,
+    discount: float = 1.0,
+    max_spread: float | None = None,
+) -> SplineModel | None:
+    """
+    LRU-cached build_spline_model for repeated interactive runs.
+
+    Snapshots are frozen and compare by value, so a freshly rebuilt snapshot
+    over unchanged quotes hits the cache; any new quote changes the value and
+    naturally bypasses it.
+    """
+    return _build_spline_cached(snapshot, T, discount, max_spread)
@@ -15,28 +15,23 @@ Notes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from math import isfinite, log, sqrt
+from dataclasses import dataclass, field
+from functools import lru_cache
+from math import log, sqrt
 
 import numpy as np
 from domain.models import OptionSurfaceSnapshot
 from scipy.optimize import minimize
+from scipy.special import ndtr
 
 from modeler.forward_estimator import estimate_forward_put_call_parity
-from modeler.implied_vol import implied_vol_bisect
+from modeler.iv_points import extract_otm_iv_points
 
 # ----------------------------
 # Utilities
 # ----------------------------
 
 
-def _norm_cdf(x: float) -> float:
-    # stable enough for our use; avoids scipy.stats import
-    from math import erf
-
-    return 0.5 * (1.0 + erf(x / sqrt(2.0)))
-
-
 def _bs_prob_above(*, F: float, K: float, T: float, sigma: float) -> float:
     """Risk-neutral probability that S_T > K."""
     if F <= 0 or K <= 0 or T <= 0 or sigma <= 0:
@@ -44,7 +39,7 @@ def _bs_prob_above(*, F: float, K: float, T: float, sigma: float) -> float:
     vol_sqrt = sigma * sqrt(T)
     d2 = (log(F / K) + 0.5 * sigma * sigma * T) / vol_sqrt
     # P(S_T > K) = N(d2) in risk-neutral measure
-    return _norm_cdf(d2)
+    return float(ndtr(d2))
 
 
 # ----------------------------
@@ -58,6 +53,12 @@ def svi_total_variance(k: np.ndarray, a: float, b: float, rho: float, m: float,
     return a + b * (rho * km + np.sqrt(km * km + sig * sig))
 
 
+def svi_total_variance_scalar(k: float, a: float, b: float, rho: float, m: float, sig: float) -> float:
+    """Scalar svi_total_variance: plain math, no array boxing for single strikes."""
+    km = k - m
+    return a + b * (rho * km + sqrt(km * km + sig * sig))
+
+
 @dataclass(frozen=True, slots=True)
 class SVIParams:
     a: float
@@ -75,89 +76,41 @@ class SVIFitResult:
 
 
 # ----------------------------
-# Data extraction: OTM IVs
+# SVI fit
 # ----------------------------
 
 
-def _extract_otm_iv_points(
-    *,
-    snapshot: OptionSurfaceSnapshot,
-    F: float,
-    T: float,
-    discount: float,
-    max_spread: float | None,
-    min_mid: float = 1e-6,
-) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
-    """
-    Returns arrays (k, w, weights) where:
-      k = ln(K/F)
-      w = sigma^2 * T
-    Uses OTM option per strike:
-      - put if K < F
-      - call if K >= F
+def _svi_inner_solve(
+    m: float,
+    sig: float,
+    k: np.ndarray,
+    w: np.ndarray,
+    wgt: np.ndarray,
+) -> tuple[float, float, float, float]:
     """
-    strikes = sorted(set(snapshot.call_strikes).intersection(snapshot.put_strikes))
-    if len(strikes) < 8:
-        return None
-
-    ks: list[float] = []
-    ws: list[float] = []
-    weights: list[float] = []
-
-    for K in strikes:
-        call = snapshot.get_call(K)
-        put = snapshot.get_put(K)
-        if call is None or put is None:
-            continue
-
-        if max_spread is not None and (call.spread > max_spread or put.spread > max_spread):
-            continue
-
-        # pick OTM
-        if K < F:
-            opt_type = "put"
-            price = put.mid
-            spread = put.spread
-        else:
-            opt_type = "call"
-            price = call.mid
-            spread = call.spread
-
-        if price <= min_mid or spread < 0:
-            continue
-
-        iv = implied_vol_bisect(
-            option_type=opt_type,
-            price=price,
-            F=F,
-            K=K,
-            T=T,
-            discount=discount,
-        )
-        if iv is None:
-            continue
+    Closed-form inner step of the Zeliade quasi-explicit fit.
 
-        sigma = iv.sigma
-        w = sigma * sigma * T
-        if not isfinite(w) or w <= 0:
-            continue
+    For fixed (m, sig), SVI is linear in (a, d, c) with d = b*rho, c = b:
+        w(k) = a + d*(k-m) + c*sqrt((k-m)^2 + sig^2)
+    Solve the weighted least squares in closed form, then project onto the
+    constraint set (c > 0, |d| <= 0.999*c, a >= 0).
 
-        k = log(K / F)
-        ks.append(k)
-        ws.append(w)
-
-        # weight tighter spreads higher (in IV-space, spread is a proxy)
-        weights.append(1.0 / max(spread, 1e-6))
-
-    if len(ks) < 8:
-        return None
+    Returns (weighted RSS, a, d, c).
+    """
+    km = k - m
+    root = np.sqrt(km * km + sig * sig)
 
-    return np.array(ks), np.array(ws), np.array(weights)
+    sw = np.sqrt(wgt)
+    design = np.column_stack((sw, sw * km, sw * root))
+    coef, *_ = np.linalg.lstsq(design, sw * w, rcond=None)
 
+    a, d, c = (float(v) for v in coef)
+    c = max(c, 1e-10)
+    d = min(max(d, -0.999 * c), 0.999 * c)
+    a = max(a, 0.0)
 
-# ----------------------------
-# SVI fit
-# ----------------------------
+    resid = (a + d * km + c * root) - w
+    return float(np.sum(wgt * resid * resid)), a, d, c
 
 
 def fit_svi(
@@ -167,55 +120,87 @@ def fit_svi(
     weights: np.ndarray | None = None,
 ) -> SVIParams | None:
     """
-    Weighted least squares fit for raw SVI with simple constraints.
-    Constraints enforced via bounds + penalties:
-      b > 0, sig > 0, rho in (-1,1)
-      w(k) >= 0 via penalty
+    Weighted least squares fit for raw SVI (Zeliade quasi-explicit).
+
+    Stage 1 reduces the problem to a 2-D search over (m, sig) — for fixed
+    (m, sig) the remaining parameters solve in closed form — which is far
+    harder to trap in a local minimum than the joint 5-D fit. Stage 2
+    polishes all five parameters with a bounded L-BFGS-B using the analytic
+    gradient. Constraints: b > 0, sig > 0, rho in (-1,1); w(k) >= 0 via
+    penalty in the polish.
     """
 
     if weights is None:
         weights = np.ones_like(w)
 
-    # Initial guesses (robust-ish)
-    a0 = max(1e-8, float(np.min(w)) * 0.5)
-    b0 = max(1e-6, float(np.std(w)) + 1e-3)
-    rho0 = 0.0
-    m0 = float(np.median(k))
-    sig0 = max(1e-3, float(np.std(k)) + 1e-3)
+    wgt = weights / max(float(np.mean(weights)), 1e-12)
+
+    # --- Stage 1: 2-D outer search over (m, sig), inner solve closed form
+    k_lo = float(np.min(k))
+    k_hi = float(np.max(k))
+    k_span = max(k_hi - k_lo, 1e-3)
 
-    x0 = np.array([a0, b0, rho0, m0, sig0], dtype=float)
+    def outer(x: np.ndarray) -> float:
+        return _svi_inner_solve(float(x[0]), float(x[1]), k, w, wgt)[0]
 
-    bounds = [
-        (0.0, None),  # a
-        (1e-10, None),  # b
-        (-0.999, 0.999),  # rho
-        (None, None),  # m
-        (1e-10, None),  # sig
-    ]
+    outer_x0 = np.array([float(np.median(k)), max(1e-3, float(np.std(k)) + 1e-3)])
+    outer_res = minimize(
+        outer,
+        outer_x0,
+        method="Nelder-Mead",
+        bounds=[(k_lo - k_span, k_hi + k_span), (1e-4, 5.0)],
+    )
 
-    wgt = weights / max(float(np.mean(weights)), 1e-12)
+    m, sig = (float(v) for v in outer_res.x)
+    _, a, d, c = _svi_inner_solve(m, sig, k, w, wgt)
+    b = c
+    rho = d / c
 
-    def objective(x: np.ndarray) -> float:
+    # --- Stage 2: full 5-D polish with analytic gradient
+    def objective(x: np.ndarray) -> tuple[float, np.ndarray]:
         a, b, rho, m, sig = x
-        w_hat = svi_total_variance(k, a, b, rho, m, sig)
+        km = k - m
+        root = np.sqrt(km * km + sig * sig)
+        w_hat = a + b * (rho * km + root)
         resid = w_hat - w
-        loss = float(np.sum(wgt * resid * resid))
 
         # Penalty: discourage negative total variance
         neg = np.minimum(w_hat, 0.0)
+
+        loss = float(np.sum(wgt * resid * resid))
         loss += 1e6 * float(np.sum(neg * neg))
 
-        # Soft regularization to avoid absurd parameters
-        loss += 1e-3 * float((m * m) + (sig * sig))
+        # Analytic gradient: dloss/dw_hat, chained through w_hat's partials.
+        # Saves L-BFGS-B from finite differences (5 extra evals per step).
+        g = 2.0 * (wgt * resid + 1e6 * neg)
+        d_b = rho * km + root
+        grad = np.array(
+            [
+                float(np.sum(g)),  # d/da
+                float(np.sum(g * d_b)),  # d/db
+                float(np.sum(g * b * km)),  # d/drho
+                float(np.sum(g * -b * (rho + km / root))),  # d/dm
+                float(np.sum(g * b * sig / root)),  # d/dsig
+            ]
+        )
+        return loss, grad
 
-        return loss
+    x0 = np.array([a, b, rho, m, sig], dtype=float)
+    bounds = [
+        (0.0, None),  # a
+        (1e-10, None),  # b
+        (-0.999, 0.999),  # rho
+        (k_lo - k_span, k_hi + k_span),  # m
+        (1e-10, 5.0),  # sig
+    ]
 
-    res = minimize(objective, x0, method="L-BFGS-B", bounds=bounds)
+    res = minimize(objective, x0, method="L-BFGS-B", jac=True, bounds=bounds)
 
-    if not res.success:
+    if res.success:
+        a, b, rho, m, sig = (float(v) for v in res.x)
+    elif not np.isfinite(outer_res.fun):
         return None
 
-    a, b, rho, m, sig = (float(v) for v in res.x)
     return SVIParams(a=a, b=b, rho=rho, m=m, sig=sig)
 
 
@@ -230,18 +215,52 @@ class SVIModel:
     T: float
     discount: float
 
+    # Lazy scalar-path constants: sqrt(T) and log(F) never change for a
+    # fitted model, so per-strike queries skip the repeated transcendentals.
+    _sqrt_t: float | None = field(default=None, init=False, repr=False, compare=False)
+    _log_f: float | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _constants(self) -> tuple[float, float]:
+        sqrt_T = self._sqrt_t
+        if sqrt_T is None:
+            sqrt_T = sqrt(self.T)
+            object.__setattr__(self, "_sqrt_t", sqrt_T)
+            object.__setattr__(self, "_log_f", log(self.fit.forward))
+        assert self._log_f is not None
+        return sqrt_T, self._log_f
+
     def implied_vol(self, K: float) -> float:
-        F = self.fit.forward
-        k = log(K / F)
+        _, log_F = self._constants()
         p = self.fit.params
-        w = float(svi_total_variance(np.array([k]), p.a, p.b, p.rho, p.m, p.sig)[0])
-        w = max(w, 1e-12)
+        w = max(svi_total_variance_scalar(log(K) - log_F, p.a, p.b, p.rho, p.m, p.sig), 1e-12)
         return sqrt(w / self.T)
 
     def prob_above(self, K: float) -> float:
-        sigma = self.implied_vol(K)
-        p = _bs_prob_above(F=self.fit.forward, K=K, T=self.T, sigma=sigma)
-        return max(0.0, min(1.0, float(p)))
+        sqrt_T, log_F = self._constants()
+        p = self.fit.params
+
+        k = log(K) - log_F
+        w = max(svi_total_variance_scalar(k, p.a, p.b, p.rho, p.m, p.sig), 1e-12)
+        sigma = sqrt(w / self.T)
+
+        d = (-k + 0.5 * sigma * sigma * self.T) / (sigma * sqrt_T)
+        return min(max(float(ndtr(d)), 0.0), 1.0)
+
+    def prob_above_batch(self, Ks: np.ndarray) -> np.ndarray:
+        """Vectorized P(S_T > K): one SVI evaluation for the whole grid."""
+        Ks = np.asarray(Ks, dtype=np.float64)
+        F = self.fit.forward
+        p = self.fit.params
+
+        k = np.log(Ks / F)
+        w = np.maximum(svi_total_variance(k, p.a, p.b, p.rho, p.m, p.sig), 1e-12)
+        sigma = np.sqrt(w / self.T)
+
+        vol_sqrt = sigma * sqrt(self.T)
+        d = (np.log(F / Ks) + 0.5 * sigma * sigma * self.T) / vol_sqrt
+        out = ndtr(d)
+        np.clip(out, 0.0, 1.0, out=out)
+        return out
 
 
 def build_svi_model(
@@ -251,32 +270,46 @@ def build_svi_model(
     discount: float = 1.0,
     max_spread: float | None = None,
     trim_pct: float = 0.02,
+    precomputed_forward: float | None = None,
+    precomputed_points: tuple[np.ndarray, np.ndarray, np.ndarray, float] | None = None,
 ) -> SVIModel | None:
     """
     Fit SVI for one snapshot. Returns None if insufficient data.
-    """
 
-    f_est = estimate_forward_put_call_parity(
-        snapshot=snapshot,
-        discount=discount,
-        max_spread=max_spread,
-        trim_pct=trim_pct,
-    )
-    if f_est is None:
-        return None
-    F = f_est.forward
+    precomputed_points is an optional (k, w, weights, F) tuple from
+    extract_otm_iv_points; when supplied, forward estimation and IV
+    extraction are skipped so callers fitting several models per expiry
+    pay for them once. precomputed_forward skips just the put-call parity
+    regression for callers that already estimated the forward.
+    """
 
-    pts = _extract_otm_iv_points(
-        snapshot=snapshot,
-        F=F,
-        T=T,
-        discount=discount,
-        max_spread=max_spread,
-    )
-    if pts is None:
-        return None
+    if precomputed_points is not None:
+        k, w, weights, F = precomputed_points
+    else:
+        if precomputed_forward is not None:
+            F = precomputed_forward
+        else:
+            f_est = estimate_forward_put_call_parity(
+                snapshot=snapshot,
+                discount=discount,
+                max_spread=max_spread,
+                trim_pct=trim_pct,
+            )
+            if f_est is None:
+                return None
+            F = f_est.forward
+
+        pts = extract_otm_iv_points(
+            snapshot=snapshot,
+            F=F,
+            T=T,
+            discount=discount,
+            max_spread=max_spread,
+        )
+        if pts is None:
+            return None
 
-    k, w, weights = pts
+        k, w, weights = pts
     params = fit_svi(k=k, w=w, weights=weights)
     if params is None:
         return None
@@ -286,3 +319,30 @@ def build_svi_model(
         T=T,
         discount=discount,
     )
+
+
+@lru_cache(maxsize=128)
+def _build_svi_cached(
+    snapshot: OptionSurfaceSnapshot,
+    T: float,
+    discount: float,
+    max_spread: float | None,
+) -> SVIModel | None:
+    return build_svi_model(snapshot=snapshot, T=T, discount=discount, max_spread=max_spread)
+
+
+def build_svi_model_cached(
+    *,
+    snapshot: OptionSurfaceSnapshot,
+    T: float,
+    discount: float = 1.0,
+    max_spread: float | None = None,
+) -> SVIModel | None:
+    """
+    LRU-cached build_svi_model for repeated interactive runs.
+
+    Snapshots are frozen and compare by value, so a freshly rebuilt snapshot
+    over unchanged quotes hits the cache; any new quote changes the value and
+    naturally bypasses it.
+    """
+    return _build_svi_cached(snapshot, T, discount, max_spread)
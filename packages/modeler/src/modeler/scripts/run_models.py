@@ -8,6 +8,9 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from math import isnan
 
@@ -18,115 +21,184 @@ from dotenv import load_dotenv
 from massive import RESTClient
 from massive.rest.models.snapshot import OptionContractSnapshot
 from modeler import (
+    SimpleModel,
+    SlopeModel,
+    SplineModel,
+    SVIModel,
     build_simple_model,
     build_slope_model,
     build_spline_model,
     build_svi_model,
     estimate_forward_put_call_parity,
+    extract_otm_iv_points,
 )
 from store import EventStore, OptionStore, build_surface_snapshot
 
 load_dotenv()
 
 
-def run_models_for_expiry(
+@dataclass(frozen=True, slots=True)
+class ExpiryContext:
+    """Per-expiry models and metadata, fit once and scored per strike."""
+
+    symbol: Symbol
+    expiration_date: datetime
+    tte_days: int
+    forward: float | None
+    simple: SimpleModel
+    slope: SlopeModel
+    svi: SVIModel | None
+    spline: SplineModel | None
+    event_store: EventStore | None
+    pm_end_date: str | None
+
+
+def prepare_expiry(
     *,
     store: OptionStore,
     symbol: Symbol,
     expiration_date: datetime,
-    strike: float,
     max_spread: float | None = 1.0,
     event_store: EventStore | None = None,
-) -> ExpiryPredictions:
-    """Run all models for a single expiry and return predictions."""
+) -> ExpiryContext:
+    """
+    Build the snapshot and fit every model for one expiry.
+
+    None of this depends on the queried strike, so callers scoring a strike
+    grid should prepare once per expiry and then call score_strike per
+    strike — the SVI/spline fits dominate and must not run per strike.
+    """
     today = datetime.now(UTC).date()
     tte_days = (expiration_date.date() - today).days
     T = tte_days / 365.0
 
     snapshot = build_surface_snapshot(
-        states=store.get_by_symbol(symbol),
+        states=store.get_by_expiry(symbol, expiration_date),
         symbol=symbol,
         expiration_date=expiration_date,
         max_spread=max_spread,
     )
 
-    predictions: list[ModelPrediction] = []
-
-    # Forward estimate
     fwd_est = estimate_forward_put_call_parity(snapshot=snapshot, max_spread=max_spread)
     forward = fwd_est.forward if fwd_est else None
 
-    # Simple model
-    simple = build_simple_model(snapshot, max_spread=max_spread)
-    prob = simple.prob_above(strike)
+    # Extract the OTM implied-vol points once; SVI and spline fit the same data
+    svi: SVIModel | None = None
+    spline: SplineModel | None = None
+    if T > 0 and forward is not None:
+        pts = extract_otm_iv_points(snapshot=snapshot, F=forward, T=T, discount=1.0, max_spread=max_spread)
+        if pts is not None:
+            precomputed = (*pts, forward)
+            svi = build_svi_model(snapshot=snapshot, T=T, max_spread=max_spread, precomputed_points=precomputed)
+            spline = build_spline_model(snapshot=snapshot, T=T, max_spread=max_spread, precomputed_points=precomputed)
+
+    pm_end_date: str | None = None
+    if event_store:
+        exp_iso = expiration_date.isoformat().replace("+00:00", "Z")
+        events = event_store.get_by_symbol(symbol)
+        pm_end_date = next((e.end_date for e in events if e.end_date == exp_iso), None)
+
+    return ExpiryContext(
+        symbol=symbol,
+        expiration_date=expiration_date,
+        tte_days=tte_days,
+        forward=forward,
+        simple=build_simple_model(snapshot, max_spread=max_spread),
+        slope=build_slope_model(snapshot, max_spread=max_spread),
+        svi=svi,
+        spline=spline,
+        event_store=event_store,
+        pm_end_date=pm_end_date,
+    )
+
+
+def score_strike(ctx: ExpiryContext, strike: float) -> ExpiryPredictions:
+    """Score one strike against the cached per-expiry models."""
+    predictions: list[ModelPrediction] = []
+
+    prob = ctx.simple.prob_above(strike)
     predictions.append(
         ModelPrediction(
             model_name="simple",
             prob_above=None if isnan(prob) else prob,
-            forward=forward,
+            forward=ctx.forward,
         )
     )
 
-    # Slope model
-    slope = build_slope_model(snapshot, max_spread=max_spread)
-    prob = slope.prob_above(strike)
+    prob = ctx.slope.prob_above(strike)
     predictions.append(
         ModelPrediction(
             model_name="slope",
             prob_above=None if isnan(prob) else prob,
-            forward=forward,
+            forward=ctx.forward,
         )
     )
 
-    # SVI model
-    if T > 0 and (svi := build_svi_model(snapshot=snapshot, T=T, max_spread=max_spread)):
+    if ctx.svi:
         predictions.append(
             ModelPrediction(
                 model_name="svi",
-                prob_above=svi.prob_above(strike),
-                forward=svi.fit.forward,
-                extra={"n_points": svi.fit.n_points},
+                prob_above=ctx.svi.prob_above(strike),
+                forward=ctx.svi.fit.forward,
+                extra={"n_points": ctx.svi.fit.n_points},
             )
         )
     else:
         predictions.append(ModelPrediction(model_name="svi", prob_above=None))
 
-    # Spline model
-    if T > 0 and (spline := build_spline_model(snapshot=snapshot, T=T, max_spread=max_spread)):
+    if ctx.spline:
         predictions.append(
             ModelPrediction(
                 model_name="spline",
-                prob_above=spline.prob_above(strike),
-                forward=spline.fit.forward,
-                extra={"n_points": spline.fit.n_points},
+                prob_above=ctx.spline.prob_above(strike),
+                forward=ctx.spline.fit.forward,
+                extra={"n_points": ctx.spline.fit.n_points},
             )
         )
     else:
         predictions.append(ModelPrediction(model_name="spline", prob_above=None))
 
-    # Polymarket
-    if event_store:
-        exp_iso = expiration_date.isoformat().replace("+00:00", "Z")
-        events = event_store.get_by_symbol(symbol)
-        pm_end_date = next((e.end_date for e in events if e.end_date == exp_iso), None)
-        if pm_end_date:
+    if ctx.event_store:
+        if ctx.pm_end_date:
             predictions.append(
                 ModelPrediction(
                     model_name="polymarket",
-                    prob_above=event_store.get_polymarket_prob(symbol, pm_end_date, strike, direction="above"),
+                    prob_above=ctx.event_store.get_polymarket_prob(
+                        ctx.symbol, ctx.pm_end_date, strike, direction="above"
+                    ),
                 )
             )
         else:
             predictions.append(ModelPrediction(model_name="polymarket", prob_above=None))
 
     return ExpiryPredictions(
-        expiration_date=expiration_date,
-        tte_days=tte_days,
+        expiration_date=ctx.expiration_date,
+        tte_days=ctx.tte_days,
         strike_price=strike,
         predictions=predictions,
     )
 
 
+def run_models_for_expiry(
+    *,
+    store: OptionStore,
+    symbol: Symbol,
+    expiration_date: datetime,
+    strike: float,
+    max_spread: float | None = 1.0,
+    event_store: EventStore | None = None,
+) -> ExpiryPredictions:
+    """Run all models for a single expiry + strike (one-shot convenience)."""
+    ctx = prepare_expiry(
+        store=store,
+        symbol=symbol,
+        expiration_date=expiration_date,
+        max_spread=max_spread,
+        event_store=event_store,
+    )
+    return score_strike(ctx, strike)
+
+
 def get_expiries(store: OptionStore, symbol: Symbol, n_days: int) -> list[datetime]:
     """Get expiries for symbol within next N days (including today)."""
     today = datetime.now(UTC).date()
@@ -246,17 +318,18 @@ def main() -> None:
         strikes = store.get_strikes(symbol)
         print(f"Running for {len(strikes)} strikes: {strikes[0]:.0f} - {strikes[-1]:.0f}")
 
-    results = [
-        run_models_for_expiry(
-            store=store,
-            symbol=symbol,
-            expiration_date=exp,
-            strike=strike,
-            event_store=event_store,
+    # Fit models once per expiry; only prob_above(strike) runs per strike.
+    # Expiries are independent and the SVI/spline fits spend their time in
+    # SciPy, which releases the GIL, so prepare them in parallel.
+    with ThreadPoolExecutor(max_workers=min(len(expiries), os.cpu_count() or 1)) as pool:
+        ctxs = list(
+            pool.map(
+                lambda exp: prepare_expiry(store=store, symbol=symbol, expiration_date=exp, event_store=event_store),
+                expiries,
+            )
         )
-        for exp in expiries
-        for strike in strikes
-    ]
+
+    results: list[ExpiryPredictions] = [score_strike(ctx, strike) for ctx in ctxs for strike in strikes]
 
     print_predictions(results)
 
@@ -0,0 +1,31 @@
+"""Strike array helpers shared by the strike-level estimators."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def nearest_strike_index(strikes: Sequence[float] | np.ndarray, strike: float) -> int | None:
+    """
+    Index of the entry closest to `strike` in an ascending-sorted sequence.
+
+    O(log N) bisect plus one neighbor comparison instead of a linear scan;
+    ties go to the lower strike. Snapshot builders sort strikes ascending,
+    so callers can pass snapshot strike lists directly.
+
+    Returns None if the sequence is empty.
+    """
+    n = len(strikes)
+    if n == 0:
+        return None
+
+    idx = bisect_left(strikes, strike)
+    if idx == 0:
+        return 0
+    if idx == n:
+        return n - 1
+
+    if strikes[idx] - strike < strike - strikes[idx - 1]:
+        return idx
+    return idx - 1
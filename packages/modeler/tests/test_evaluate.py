@@ -0,0 +1,93 @@
+"""Tests for fused surface evaluation."""
+
+import numpy as np
+import pytest
+from domain.models import OptionPoint, OptionSurfaceSnapshot
+from domain.types import Symbol, make_expiry_datetime
+from modeler.confidence_score import compute_confidence
+from modeler.evaluate import evaluate_surface
+from modeler.models.simple import estimate_probability_simple
+from modeler.models.slope import estimate_probability_slope
+
+# Use a valid Symbol for tests
+TEST_SYMBOL: Symbol = "NVDA"
+TEST_EXPIRY = make_expiry_datetime("2025-01-17")
+
+
+def _point(strike: float, option_type: str, mid: float, spread: float) -> OptionPoint:
+    half = spread / 2
+    return OptionPoint(
+        strike=strike,
+        option_type=option_type,
+        bid=mid - half,
+        ask=mid + half,
+        mid=mid,
+        spread=spread,
+    )
+
+
+class TestEvaluateSurface:
+    """Tests for evaluate_surface."""
+
+    @pytest.fixture
+    def snapshot(self) -> OptionSurfaceSnapshot:
+        calls = (
+            _point(80.0, "call", 18.0, 1.0),
+            _point(90.0, "call", 9.0, 1.0),
+            _point(100.0, "call", 5.0, 1.0),
+            _point(110.0, "call", 1.0, 1.0),
+            _point(120.0, "call", 0.3, 0.4),
+        )
+        puts = (
+            _point(80.0, "put", 0.4, 0.4),
+            _point(90.0, "put", 1.2, 1.0),
+            _point(100.0, "put", 5.0, 1.0),
+            _point(110.0, "put", 9.5, 1.0),
+            _point(120.0, "put", 18.5, 1.0),
+        )
+        return OptionSurfaceSnapshot(symbol=TEST_SYMBOL, expiration_date=TEST_EXPIRY, calls=calls, puts=puts)
+
+    def test_matches_scalar_estimators(self, snapshot: OptionSurfaceSnapshot) -> None:
+        strikes = [90.0, 100.0, 110.0]
+        result = evaluate_surface(snapshot=snapshot, Ks=np.array(strikes))
+
+        for j, strike in enumerate(strikes):
+            simple = estimate_probability_simple(snapshot=snapshot, strike=strike)
+            slope = estimate_probability_slope(snapshot=snapshot, strike=strike)
+            assert simple is not None
+            assert slope is not None
+            assert result.prob_simple[j] == pytest.approx(simple.prob_above)
+            assert result.prob_slope[j] == pytest.approx(slope.prob_above)
+
+    def test_matches_scalar_confidence(self, snapshot: OptionSurfaceSnapshot) -> None:
+        strikes = [80.0, 90.0, 100.0, 110.0, 120.0]
+        result = evaluate_surface(snapshot=snapshot, Ks=np.array(strikes))
+
+        for j, strike in enumerate(strikes):
+            expected, _ = compute_confidence(
+                snapshot=snapshot,
+                strike=strike,
+                prob_simple=estimate_probability_simple(snapshot=snapshot, strike=strike),
+                prob_slope=estimate_probability_slope(snapshot=snapshot, strike=strike),
+            )
+            assert result.confidence[j] == pytest.approx(expected)
+
+    def test_unknown_strike_low_confidence(self, snapshot: OptionSurfaceSnapshot) -> None:
+        result = evaluate_surface(snapshot=snapshot, Ks=np.array([105.0]))
+
+        assert np.isnan(result.prob_simple[0])
+        expected, _ = compute_confidence(
+            snapshot=snapshot,
+            strike=105.0,
+            prob_simple=None,
+            prob_slope=estimate_probability_slope(snapshot=snapshot, strike=105.0),
+        )
+        assert result.confidence[0] == pytest.approx(expected)
+
+    def test_empty_snapshot(self) -> None:
+        snapshot = OptionSurfaceSnapshot(symbol=TEST_SYMBOL, expiration_date=TEST_EXPIRY, calls=(), puts=())
+        result = evaluate_surface(snapshot=snapshot, Ks=np.array([100.0]))
+
+        assert np.isnan(result.prob_simple[0])
+        assert np.isnan(result.prob_slope[0])
+        assert result.confidence[0] == 0.0
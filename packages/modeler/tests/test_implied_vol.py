@@ -0,0 +1,135 @@
+"""Tests for implied volatility inversion."""
+
+import numpy as np
+import pytest
+from modeler.implied_vol import (
+    bs_price_forward,
+    bs_price_forward_batch,
+    implied_vol,
+    implied_vol_bisect,
+    implied_vol_bisect_batch,
+    implied_vol_newton_batch,
+)
+
+
+class TestImpliedVol:
+    """Round-trip tests: price at a known vol, invert, recover the vol."""
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    @pytest.mark.parametrize("sigma", [0.1, 0.3, 0.8])
+    @pytest.mark.parametrize("K", [80.0, 100.0, 120.0])
+    def test_newton_round_trip(self, option_type: str, sigma: float, K: float) -> None:
+        F, T = 100.0, 0.25
+        price = bs_price_forward(option_type=option_type, F=F, K=K, T=T, sigma=sigma)
+
+        result = implied_vol(option_type=option_type, price=price, F=F, K=K, T=T)
+
+        assert result is not None
+        assert result.sigma == pytest.approx(sigma, rel=1e-4)
+
+    def test_newton_matches_bisection(self) -> None:
+        F, K, T, sigma = 100.0, 110.0, 0.5, 0.35
+        price = bs_price_forward(option_type="call", F=F, K=K, T=T, sigma=sigma)
+
+        newton = implied_vol(option_type="call", price=price, F=F, K=K, T=T)
+        bisect = implied_vol_bisect(option_type="call", price=price, F=F, K=K, T=T)
+
+        assert newton is not None and bisect is not None
+        assert newton.sigma == pytest.approx(bisect.sigma, rel=1e-4)
+        assert newton.iterations < bisect.iterations
+
+    def test_sigma_hint_warm_start(self) -> None:
+        F, K, T, sigma = 100.0, 105.0, 0.5, 0.4
+        price = bs_price_forward(option_type="call", F=F, K=K, T=T, sigma=sigma)
+
+        cold = implied_vol_bisect(option_type="call", price=price, F=F, K=K, T=T)
+        warm = implied_vol_bisect(option_type="call", price=price, F=F, K=K, T=T, sigma_hint=0.38)
+
+        assert cold is not None and warm is not None
+        assert warm.sigma == pytest.approx(cold.sigma, rel=1e-4)
+        assert warm.iterations < cold.iterations
+
+    def test_sigma_hint_exact_returns_immediately(self) -> None:
+        F, K, T, sigma = 100.0, 100.0, 0.25, 0.3
+        price = bs_price_forward(option_type="call", F=F, K=K, T=T, sigma=sigma)
+
+        result = implied_vol_bisect(option_type="call", price=price, F=F, K=K, T=T, sigma_hint=sigma)
+
+        assert result is not None
+        assert result.iterations == 0
+        assert result.sigma == pytest.approx(sigma)
+
+    def test_invalid_price_returns_none(self) -> None:
+        assert implied_vol(option_type="call", price=-1.0, F=100.0, K=100.0, T=0.25) is None
+
+    def test_price_above_no_arb_bound_returns_none(self) -> None:
+        # Call cannot exceed D*F
+        assert implied_vol(option_type="call", price=200.0, F=100.0, K=100.0, T=0.25) is None
+
+
+class TestBatchKernels:
+    """Batch pricing/inversion agrees with the scalar implementations."""
+
+    def test_batch_price_matches_scalar(self) -> None:
+        F, T, sigma = 100.0, 0.25, 0.3
+        Ks = np.array([80.0, 100.0, 120.0])
+        is_call = np.array([True, False, True])
+
+        batch = bs_price_forward_batch(is_call=is_call, F=F, K=Ks, T=T, sigma=np.full(3, sigma))
+
+        for i, (K, call) in enumerate(zip(Ks, is_call, strict=True)):
+            opt = "call" if call else "put"
+            assert batch[i] == pytest.approx(bs_price_forward(option_type=opt, F=F, K=float(K), T=T, sigma=sigma))
+
+    def test_batch_bisect_round_trip(self) -> None:
+        F, T = 100.0, 0.5
+        Ks = np.array([90.0, 100.0, 110.0])
+        sigmas = np.array([0.2, 0.3, 0.4])
+        is_call = np.array([True, True, False])
+        prices = bs_price_forward_batch(is_call=is_call, F=F, K=Ks, T=T, sigma=sigmas)
+
+        out = implied_vol_bisect_batch(is_call=is_call, prices=prices, F=F, K=Ks, T=T)
+
+        assert out == pytest.approx(sigmas, rel=1e-4)
+
+    def test_batch_bisect_invalid_is_nan(self) -> None:
+        out = implied_vol_bisect_batch(
+            is_call=np.array([True]),
+            prices=np.array([-1.0]),
+            F=100.0,
+            K=np.array([100.0]),
+            T=0.25,
+        )
+        assert np.isnan(out[0])
+
+    def test_batch_newton_round_trip(self) -> None:
+        F, T = 100.0, 0.5
+        Ks = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+        sigmas = np.array([0.5, 0.2, 0.3, 0.4, 0.8])
+        is_call = Ks >= F
+        prices = bs_price_forward_batch(is_call=is_call, F=F, K=Ks, T=T, sigma=sigmas)
+
+        out = implied_vol_newton_batch(is_call=is_call, prices=prices, F=F, K=Ks, T=T)
+
+        assert out == pytest.approx(sigmas, rel=1e-4)
+
+    def test_batch_newton_matches_bisect(self) -> None:
+        F, T = 100.0, 0.25
+        Ks = np.array([95.0, 100.0, 105.0])
+        is_call = np.array([False, True, True])
+        prices = bs_price_forward_batch(is_call=is_call, F=F, K=Ks, T=T, sigma=np.full(3, 0.35))
+
+        newton = implied_vol_newton_batch(is_call=is_call, prices=prices, F=F, K=Ks, T=T)
+        bisect = implied_vol_bisect_batch(is_call=is_call, prices=prices, F=F, K=Ks, T=T)
+
+        assert newton == pytest.approx(bisect, rel=1e-4)
+
+    def test_batch_newton_invalid_is_nan(self) -> None:
+        out = implied_vol_newton_batch(
+            is_call=np.array([True]),
+            prices=np.array([200.0]),  # above the D*F no-arb bound
+            F=100.0,
+            K=np.array([100.0]),
+            T=0.25,
+        )
+        assert np.isnan(out[0])
@@ -1,9 +1,12 @@
 """Tests for simple probability estimator."""
 
+import math
+
+import numpy as np
 import pytest
 from domain.models import OptionPoint, OptionSurfaceSnapshot
 from domain.types import Symbol, make_expiry_datetime
-from modeler.models.simple import estimate_probability_simple
+from modeler.models.simple import build_simple_model, estimate_probability_simple
 
 # Use a valid Symbol for tests
 TEST_SYMBOL: Symbol = "NVDA"
@@ -107,3 +110,48 @@ class TestEstimateProbabilitySimple:
     def test_max_spread_filter_accepts_tight_quotes(self, snapshot: OptionSurfaceSnapshot) -> None:
         result = estimate_probability_simple(snapshot=snapshot, strike=100.0, max_spread=1.0)
         assert result is not None
+
+
+class TestSimpleModelBatch:
+    """Tests for SimpleModel.prob_above_batch."""
+
+    @pytest.fixture
+    def snapshot(self) -> OptionSurfaceSnapshot:
+        calls = (
+            OptionPoint(strike=90.0, option_type="call", bid=7.0, ask=8.0, mid=7.5, spread=1.0),
+            OptionPoint(strike=100.0, option_type="call", bid=4.8, ask=5.2, mid=5.0, spread=0.4),
+        )
+        puts = (
+            OptionPoint(strike=90.0, option_type="put", bid=2.0, ask=3.0, mid=2.5, spread=1.0),
+            OptionPoint(strike=100.0, option_type="put", bid=4.8, ask=5.2, mid=5.0, spread=0.4),
+        )
+        return OptionSurfaceSnapshot(symbol=TEST_SYMBOL, expiration_date=TEST_EXPIRY, calls=calls, puts=puts)
+
+    def test_batch_matches_scalar(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_simple_model(snapshot)
+
+        result = model.prob_above_batch(np.array([90.0, 100.0]))
+
+        assert result[0] == pytest.approx(0.75)
+        assert result[1] == pytest.approx(0.5)
+
+    def test_unknown_strike_is_nan(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_simple_model(snapshot)
+
+        result = model.prob_above_batch(np.array([95.0, 999.0]))
+
+        assert np.isnan(result).all()
+
+    def test_scalar_wrapper(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_simple_model(snapshot)
+
+        assert model.prob_above(100.0) == pytest.approx(0.5)
+        assert math.isnan(model.prob_above(999.0))
+
+    def test_max_spread_filter(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_simple_model(snapshot, max_spread=0.5)
+
+        result = model.prob_above_batch(np.array([90.0, 100.0]))
+
+        assert np.isnan(result[0])  # spread 1.0 > 0.5
+        assert result[1] == pytest.approx(0.5)
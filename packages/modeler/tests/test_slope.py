@@ -1,9 +1,12 @@
 """Tests for slope-based probability estimator."""
 
+import math
+
+import numpy as np
 import pytest
 from domain.models import OptionPoint, OptionSurfaceSnapshot
 from domain.types import Symbol, make_expiry_datetime
-from modeler.models.slope import estimate_probability_slope
+from modeler.models.slope import build_slope_model, estimate_probability_slope
 
 # Use a valid Symbol for tests
 TEST_SYMBOL: Symbol = "NVDA"
@@ -119,3 +122,57 @@ class TestEstimateProbabilitySlope:
 
         result = estimate_probability_slope(snapshot=snapshot, strike=100.0)
         assert result is None
+
+
+class TestSlopeModelBatch:
+    """Tests for SlopeModel batch queries."""
+
+    @pytest.fixture
+    def snapshot(self) -> OptionSurfaceSnapshot:
+        calls = (
+            OptionPoint(strike=80.0, option_type="call", bid=17.5, ask=18.5, mid=18.0, spread=1.0),
+            OptionPoint(strike=90.0, option_type="call", bid=8.5, ask=9.5, mid=9.0, spread=1.0),
+            OptionPoint(strike=100.0, option_type="call", bid=4.5, ask=5.5, mid=5.0, spread=1.0),
+            OptionPoint(strike=110.0, option_type="call", bid=0.5, ask=1.5, mid=1.0, spread=1.0),
+            OptionPoint(strike=120.0, option_type="call", bid=0.1, ask=0.5, mid=0.3, spread=0.4),
+        )
+        return OptionSurfaceSnapshot(symbol=TEST_SYMBOL, expiration_date=TEST_EXPIRY, calls=calls, puts=())
+
+    def test_batch_matches_scalar_estimator(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_slope_model(snapshot)
+        strikes = [90.0, 100.0, 110.0]
+
+        probs = model.prob_above_batch(np.array(strikes))
+
+        for strike, prob in zip(strikes, probs, strict=True):
+            expected = estimate_probability_slope(snapshot=snapshot, strike=strike)
+            assert expected is not None
+            assert prob == pytest.approx(expected.prob_above)
+
+    def test_edge_strikes_are_nan(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_slope_model(snapshot)
+
+        probs = model.prob_above_batch(np.array([80.0, 120.0]))
+        assert math.isnan(probs[0])
+        assert math.isnan(probs[1])
+
+    def test_scalar_prob_above(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_slope_model(snapshot)
+
+        expected = estimate_probability_slope(snapshot=snapshot, strike=100.0)
+        assert expected is not None
+        assert model.prob_above(100.0) == pytest.approx(expected.prob_above)
+        assert math.isnan(model.prob_above(80.0))
+
+    def test_max_spread_filter(self, snapshot: OptionSurfaceSnapshot) -> None:
+        model = build_slope_model(snapshot, max_spread=0.5)
+
+        probs = model.prob_above_batch(np.array([100.0]))
+        assert math.isnan(probs[0])
+
+    def test_empty_snapshot(self) -> None:
+        snapshot = OptionSurfaceSnapshot(symbol=TEST_SYMBOL, expiration_date=TEST_EXPIRY, calls=(), puts=())
+        model = build_slope_model(snapshot)
+
+        probs = model.prob_above_batch(np.array([100.0]))
+        assert math.isnan(probs[0])
@@ -0,0 +1,30 @@
+"""Tests for strike array helpers."""
+
+from modeler.strikes import nearest_strike_index
+
+
+class TestNearestStrikeIndex:
+    """Tests for nearest_strike_index."""
+
+    def test_exact_match(self) -> None:
+        assert nearest_strike_index([90.0, 100.0, 110.0], 100.0) == 1
+
+    def test_nearest_between_strikes(self) -> None:
+        assert nearest_strike_index([90.0, 100.0, 110.0], 104.0) == 1
+        assert nearest_strike_index([90.0, 100.0, 110.0], 106.0) == 2
+
+    def test_tie_goes_to_lower_strike(self) -> None:
+        assert nearest_strike_index([90.0, 100.0, 110.0], 105.0) == 1
+
+    def test_below_and_above_range(self) -> None:
+        assert nearest_strike_index([90.0, 100.0, 110.0], 50.0) == 0
+        assert nearest_strike_index([90.0, 100.0, 110.0], 200.0) == 2
+
+    def test_empty_returns_none(self) -> None:
+        assert nearest_strike_index([], 100.0) is None
+
+    def test_matches_linear_scan(self) -> None:
+        strikes = [80.0, 85.0, 90.0, 97.5, 100.0, 102.5, 110.0, 125.0]
+        for strike in [79.0, 82.4, 82.6, 91.0, 99.9, 101.0, 117.0, 130.0]:
+            expected = min(range(len(strikes)), key=lambda j: abs(strikes[j] - strike))
+            assert nearest_strike_index(strikes, strike) == expected
@@ -9,9 +9,14 @@ No locks needed — asyncio is single-threaded.
 """
 
 import asyncio
+import itertools
 import logging
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Literal, Protocol
 
 from domain.models import EventMetadata, MarketMetadata
@@ -26,7 +31,9 @@ class EventReader(Protocol):
     """Read-only view of the event store."""
 
     def get_by_symbol(self, symbol: Symbol) -> list[EventMetadata]: ...
-    def get_all(self) -> list[EventMetadata]: ...
+    def get_all(self) -> Iterable[EventMetadata]: ...
+    def events_view(self) -> Mapping[str, list[EventMetadata]]: ...
+    def count(self) -> int: ...
     def last_refresh(self) -> datetime | None: ...
     def get_polymarket_prob(
         self, symbol: Symbol, end_date: str, strike_price: float, direction: Literal["above", "below"] | None = None
@@ -34,7 +41,7 @@ class EventReader(Protocol):
     def get_market(self, symbol: Symbol, end_date: str, strike_price: float) -> MarketMetadata | None: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class EventStore:
     """
     In-memory store for Polymarket stock events.
@@ -47,29 +54,42 @@ class EventStore:
     _last_refresh: datetime | None = None
     _refresh_interval_seconds: int = 300  # 5 minutes default
 
+    # Lazy symbol -> end_date -> strike-key market index so repeated lookups
+    # are three dict probes instead of an O(events x markets) scan. Strikes
+    # are keyed in integer thousandths (OCC precision) to dodge float noise.
+    _market_index: dict[str, dict[str, dict[int, MarketMetadata]]] | None = field(default=None, repr=False)
+
+    # Dedicated single worker for the refresh loop. Keeps the blocking Gamma
+    # fetch off the shared default executor (asyncio.to_thread), where it
+    # would contend with ad-hoc offloads, and gives one named, reusable
+    # thread instead of per-call dispatch overhead.
+    _refresh_executor: ThreadPoolExecutor | None = field(default=None, repr=False)
+
     def refresh(self) -> int:
         """Fetch latest events from Gamma API and update store. Returns count."""
         events = fetch_stock_events()
 
-        new_events: dict[str, list[EventMetadata]] = {}
+        new_events: defaultdict[str, list[EventMetadata]] = defaultdict(list)
         for event in events:
             if event.symbol:
-                if event.symbol not in new_events:
-                    new_events[event.symbol] = []
                 new_events[event.symbol].append(event)
 
-        self._events = new_events
+        self._events = dict(new_events)
+        self._market_index = None
 
-        total_events = sum(len(v) for v in self._events.values())
+        total_events = self.count()
         self._last_refresh = datetime.now(UTC)
         logger.info("Refreshed event store: %d events for %d symbols", total_events, len(self._events))
         return total_events
 
     async def start_refresh_loop(self) -> None:
         """Start background refresh loop (non-blocking)."""
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-refresh")
+        loop = asyncio.get_running_loop()
         while True:
             try:
-                await asyncio.to_thread(self.refresh)
+                await loop.run_in_executor(self._refresh_executor, self.refresh)
             except Exception:
                 logger.exception("Failed to refresh events")
             await asyncio.sleep(self._refresh_interval_seconds)
@@ -77,6 +97,7 @@ class EventStore:
     def clear(self) -> None:
         """Clear all stored events."""
         self._events.clear()
+        self._market_index = None
         self._last_refresh = None
 
     # --- Read interface (EventReader) ---
@@ -96,22 +117,51 @@ class EventStore:
 
     def get_market(self, symbol: Symbol, end_date: str, strike_price: float) -> MarketMetadata | None:
         """Get market for a specific stock symbol, end date, and strike price."""
-        events = self._events.get(symbol, [])
-        for event in events:
-            if event.end_date == end_date and event.markets:
-                return next(
-                    (market for market in event.markets if market.strike_price == strike_price),
-                    None,
-                )
-        return None
+        index = self._market_index
+        if index is None:
+            index = {}
+            for sym, events in self._events.items():
+                by_end_date = index.setdefault(sym, {})
+                for event in events:
+                    if not event.end_date or not event.markets:
+                        continue
+                    by_strike = by_end_date.setdefault(event.end_date, {})
+                    for market in event.markets:
+                        if market.strike_price is not None:
+                            by_strike.setdefault(round(market.strike_price * 1000), market)
+            self._market_index = index
+
+        by_end_date = index.get(symbol)
+        if not by_end_date:
+            return None
+        by_strike = by_end_date.get(end_date)
+        if not by_strike:
+            return None
+        return by_strike.get(round(strike_price * 1000))
 
     def get_by_symbol(self, symbol: Symbol) -> list[EventMetadata]:
         """Get all events for a specific stock symbol."""
         return self._events.get(symbol, [])
 
-    def get_all(self) -> list[EventMetadata]:
-        """Get all stored events."""
-        return [event for events in self._events.values() for event in events]
+    def get_all(self) -> Iterable[EventMetadata]:
+        """Iterate all stored events lazily — no flat-list materialization."""
+        return itertools.chain.from_iterable(self._events.values())
+
+    def count(self) -> int:
+        """Get total number of stored events."""
+        return sum(len(events) for events in self._events.values())
+
+    def events_view(self) -> Mapping[str, list[EventMetadata]]:
+        """
+        Read-only view of the symbol -> events grouping.
+
+        O(1): wraps the live dict instead of materializing a copy, so hot
+        readers that walk every symbol each poll skip the per-call list
+        allocations of get_all(). refresh() swaps the underlying dict
+        wholesale, so a view taken before a refresh stays internally
+        consistent. Callers must not mutate the returned lists.
+        """
+        return MappingProxyType(self._events)
 
     def last_refresh(self) -> datetime | None:
         """Get timestamp of last successful refresh."""
@@ -1,22 +1,61 @@
 """Fetch Polymarket events matching stock price prediction pattern."""
 
-import json
+import functools
 import logging
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 import requests
 from domain.models import EventMetadata, MarketMetadata
 from domain.types import Symbol, is_symbol
 
+try:
+    # Optional fast path: orjson is a C parser, ~3-6x faster on API payloads
+    # and takes the raw bytes without an intermediate str decode.
+    from orjson import loads as _json_loads  # pyright: ignore[reportMissingImports]
+except ImportError:
+    from json import loads as _json_loads
+
 # Pattern: "Will Amazon (AMZN) finish week of December 29 above___?"
-EVENT_QUESTION_PATTERN = re.compile(r"^Will .+ \(([A-Z]+)\) finish week of .+ above___\?$")
-MARKET_QUESTION_PATTERN = re.compile(r"^Will .+ \([A-Z]+\) finish week of .+ above \$?([\d.]+)\?$")
+# re.ASCII: question text is ASCII, so \d and friends skip the Unicode tables.
+EVENT_QUESTION_PATTERN = re.compile(r"^Will .+ \(([A-Z]+)\) finish week of .+ above___\?$", re.ASCII)
+MARKET_QUESTION_PATTERN = re.compile(r"^Will .+ \([A-Z]+\) finish week of .+ above \$?([\d.]+)\?$", re.ASCII)
+# Bound methods of the compiled patterns: one global load per call instead of
+# an attribute lookup on top of it in the per-event/per-market parse loops.
+_event_match = EVENT_QUESTION_PATTERN.match
+_market_match = MARKET_QUESTION_PATTERN.match
 GAMMA_API_URL = "https://gamma-api.polymarket.com/events"
 BATCH_SIZE = 500
+# Pages fetched concurrently per wave; refresh wall time is RTT-bound, so
+# overlapping requests matters far more than parse CPU. The final wave
+# overshoots by at most PAGE_WORKERS - 1 cheap empty pages.
+PAGE_WORKERS = 4
 
 logger = logging.getLogger(__name__)
 
+# Per-offset conditional-GET cache: offset -> (etag, decoded page). The Gamma
+# API serves ETags, and most 5-minute refreshes see unchanged pages — a 304
+# skips both the body transfer and the JSON decode. Bounded by the number of
+# pages upstream, so no eviction needed.
+_page_cache: dict[int, tuple[str, list[dict]]] = {}
+
+
+def _fetch_page(session: requests.Session, params: dict, offset: int) -> list[dict]:
+    """Fetch and decode one page of events, revalidating with If-None-Match."""
+    cached = _page_cache.get(offset)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    response = session.get(GAMMA_API_URL, params={**params, "offset": offset}, headers=headers, timeout=30)
+    if cached is not None and response.status_code == 304:
+        return cached[1]
+    response.raise_for_status()
+    events = _json_loads(response.content)
+    etag = response.headers.get("ETag")
+    if isinstance(etag, str) and etag:
+        _page_cache[offset] = (etag, events)
+    return events
+
 
 def fetch_stock_events() -> list[EventMetadata]:
     """Fetch events from Polymarket Gamma API and filter for stock price questions."""
@@ -31,52 +70,67 @@ def fetch_stock_events() -> list[EventMetadata]:
 
     matching_events: list[EventMetadata] = []
     offset = 0
-
-    while True:
-        params["offset"] = offset
-        response = session.get(GAMMA_API_URL, params=params, timeout=30)
-        response.raise_for_status()
-
-        events = response.json()
-        if not events:
-            break
-
-        for event in events:
-            event_question = event.get("title", "")
-            if EVENT_QUESTION_PATTERN.match(event_question):
-                markets = []
-                all_markets = event.get("markets", [])
-
-                for market in all_markets:
-                    market_info = _get_useful_market_info(market)
-                    if market_info:
-                        markets.append(market_info)
-
-                symbol = _parse_symbol(event_question)
-                if not symbol:
-                    continue
-
-                matching_events.append(
-                    EventMetadata(
-                        symbol=symbol,
-                        question=event_question,
-                        question_id=event.get("id"),
-                        end_date=event.get("endDate"),
-                        markets=markets,
-                    )
-                )
-
-        offset += len(events)
-        if len(events) < BATCH_SIZE:
-            break
+    done = False
+
+    # Total count is unknown up front, so fetch speculative waves of pages in
+    # parallel and stop at the first short page (processed in offset order, so
+    # results match the serial pagination exactly).
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as pool:
+        while not done:
+            offsets = range(offset, offset + PAGE_WORKERS * BATCH_SIZE, BATCH_SIZE)
+            for events in pool.map(lambda off: _fetch_page(session, params, off), offsets):
+                if not events:
+                    done = True
+                    break
+
+                _collect_matching_events(events, matching_events)
+
+                if len(events) < BATCH_SIZE:
+                    done = True
+                    break
+            offset += PAGE_WORKERS * BATCH_SIZE
 
     return matching_events
 
 
+def _collect_matching_events(events: list[dict], matching_events: list[EventMetadata]) -> None:
+    """Append the stock-price events from one decoded page to matching_events."""
+    for event in events:
+        event_question = event.get("title", "")
+        # Most events on a page are not stock-price questions. Reject them
+        # with C-level prefix/suffix checks before paying for the regex
+        # engine; only plausible titles reach the match below.
+        if not event_question.startswith("Will ") or not event_question.endswith("above___?"):
+            continue
+        # Match once and validate the symbol before touching any markets —
+        # events with unknown tickers previously paid for full market
+        # extraction (and a second regex pass via _parse_symbol) only to be
+        # dropped afterwards.
+        match = _event_match(event_question)
+        if match is None:
+            continue
+        symbol = sys.intern(match.group(1))
+        if not is_symbol(symbol):
+            logger.warning("Unknown symbol parsed: %s", symbol)
+            continue
+
+        markets = [mi for m in event.get("markets", []) if (mi := _get_useful_market_info(m)) is not None]
+
+        matching_events.append(
+            EventMetadata(
+                symbol=symbol,
+                question=event_question,
+                question_id=event.get("id"),
+                end_date=event.get("endDate"),
+                markets=markets,
+            )
+        )
+
+
 def _get_useful_market_info(market: dict) -> MarketMetadata | None:
     """Extract essential market metadata from a Gamma API market dict."""
-    tokens = json.loads(market.get("clobTokenIds", "[]"))
-    prices = json.loads(market.get("outcomePrices", "[]"))
+    tokens = _json_loads(market.get("clobTokenIds", "[]"))
+    prices = _json_loads(market.get("outcomePrices", "[]"))
     market_question = market.get("question")
     if not market_question:
         return None
@@ -99,11 +153,18 @@ def _get_useful_market_info(market: dict) -> MarketMetadata | None:
     )
 
 
+@functools.lru_cache(maxsize=8192)
 def _parse_symbol(event_question: str) -> Symbol | None:
-    """Extract stock symbol from event title."""
-    match = EVENT_QUESTION_PATTERN.match(event_question)
+    """Extract stock symbol from event title.
+
+    Pure function of the string; weekly questions repeat across refreshes in
+    a long-running process, so results are memoized.
+    """
+    match = _event_match(event_question)
     if match:
-        symbol = match.group(1)
+        # Interned so EventStore's symbol-keyed dict probes hit the
+        # pointer-equality fast path.
+        symbol = sys.intern(match.group(1))
         if is_symbol(symbol):
             return symbol
 
@@ -113,10 +174,18 @@ def _parse_symbol(event_question: str) -> Symbol | None:
     return None
 
 
+@functools.lru_cache(maxsize=8192)
 def _parse_strike_price(market_question: str) -> float | None:
-    """Extract strike price from market question."""
-    match = MARKET_QUESTION_PATTERN.match(market_question)
-    if match:
-        return float(match.group(1))
+    """Extract strike price from market question.
+
+    Pure function of the string; market questions recur on every refresh
+    until the event closes, so results are memoized.
+    """
+    # Cheap substring gate before the regex — non-matching questions are the
+    # common case and string `in` is an order of magnitude cheaper.
+    if market_question.startswith("Will ") and "above" in market_question:
+        match = _market_match(market_question)
+        if match:
+            return float(match.group(1))
     logger.warning("Could not parse strike price from question: %s", market_question)
     return None
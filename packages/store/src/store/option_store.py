@@ -9,42 +9,62 @@ Single-writer architecture:
 No locks needed — asyncio is single-threaded.
 """
 
-import re
+import functools
+import sys
+from bisect import insort
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Protocol
 
 from domain.models import OptionQuoteEvent, OptionState
 from domain.types import Symbol, is_symbol, make_expiry_datetime
 
-# OCC symbol pattern: O:NVDA260117C00140000
-# Symbol: NVDA, Date: 260117 (YYMMDD), Type: C/P, Strike: 00140000 (price * 1000)
-_OCC_PATTERN = re.compile(
-    r"^O:(?P<symbol>[A-Z]+)"
-    r"(?P<yy>\d{2})(?P<mm>\d{2})(?P<dd>\d{2})"
-    r"(?P<type>[CP])"
-    r"(?P<strike>\d{8})$"
-)
+# OCC symbol layout: O:NVDA260117C00140000
+# "O:" + symbol + fixed-width tail of 6 date (YYMMDD) + 1 type (C/P) + 8 strike
+# (price * 1000). Fixed offsets parse with plain slicing; no regex engine on
+# the per-tick path.
+_OCC_TAIL = 15
 
 
+@functools.lru_cache(maxsize=4096)
+def _expiry_from_yymmdd(yymmdd: str) -> datetime:
+    """Expiry datetime for a YYMMDD string; contracts share expiries across
+    thousands of quotes, so memoize the datetime construction."""
+    return make_expiry_datetime(f"20{yymmdd[:2]}-{yymmdd[2:4]}-{yymmdd[4:6]}")
+
+
+@functools.lru_cache(maxsize=16384)
 def parse_occ_symbol(occ_symbol: str) -> tuple[Symbol, datetime, str, float] | None:
     """
     Parse OCC option symbol.
 
     Returns (symbol, expiration_date, option_type, strike) or None if invalid.
+
+    Pure function over the raw string, and the same contract ticks thousands
+    of times per session, so results are memoized — a hit is one dict probe.
     """
-    match = _OCC_PATTERN.match(occ_symbol)
-    if not match:
+    if len(occ_symbol) < 2 + _OCC_TAIL + 1 or not occ_symbol.startswith("O:"):
         return None
 
-    symbol_str = match.group("symbol")
+    tail = occ_symbol[-_OCC_TAIL:]
+    date_part = tail[:6]
+    type_ch = tail[6]
+    strike_part = tail[7:]
+
+    if not (date_part.isdigit() and strike_part.isdigit()) or (type_ch != "C" and type_ch != "P"):
+        return None
+
+    # Intern so every index keyed on the symbol compares by pointer on the
+    # dict fast path; the lru_cache above means this runs once per contract.
+    symbol_str = sys.intern(occ_symbol[2:-_OCC_TAIL])
     if not is_symbol(symbol_str):
         return None
 
-    yy, mm, dd = match.group("yy"), match.group("mm"), match.group("dd")
-    expiration_date = make_expiry_datetime(f"20{yy}-{mm}-{dd}")
-    option_type = "call" if match.group("type") == "C" else "put"
-    strike = int(match.group("strike")) / 1000.0
+    expiration_date = _expiry_from_yymmdd(date_part)
+    option_type = "call" if type_ch == "C" else "put"
+    strike = int(strike_part) / 1000.0
 
     return symbol_str, expiration_date, option_type, strike
 
@@ -54,7 +74,9 @@ class StateReader(Protocol):
 
     def get(self, occ_symbol: str) -> OptionState | None: ...
     def get_all(self) -> dict[str, OptionState]: ...
+    def states_view(self) -> Mapping[str, OptionState]: ...
     def get_by_symbol(self, symbol: Symbol) -> list[OptionState]: ...
+    def get_by_expiry(self, symbol: Symbol, expiration_date: datetime) -> list[OptionState]: ...
     def get_by_strike(self, symbol: Symbol, strike: float) -> list[OptionState]: ...
     def get_strikes(self, symbol: Symbol) -> list[float]: ...
     def count(self) -> int: ...
@@ -64,6 +86,7 @@ class StateWriter(Protocol):
     """Write interface — only the store owner should use this."""
 
     def apply_quote(self, quote: OptionQuoteEvent) -> OptionState | None: ...
+    def apply_quotes(self, quotes: Iterable[OptionQuoteEvent]) -> int: ...
     def clear(self) -> None: ...
 
 
@@ -77,11 +100,22 @@ class OptionStore:
     - Handles symbol parsing, mid/spread calculation
     - Returns the updated state (or None if symbol is invalid)
 
-    No locks — designed for single-threaded asyncio.
+    No locks — designed for single-threaded asyncio. A single dict is
+    deliberate: per-key reads/writes are GIL-atomic in CPython, so there is
+    no store-level lock to contend on (and hence nothing to shard).
     """
 
     _states: dict[str, OptionState] = field(default_factory=dict)
 
+    # Inverted indexes maintained incrementally in apply_quote so the read
+    # interface never sweeps the full store. Strike buckets key on integer
+    # thousandths (OCC precision); _strikes stays sorted via insort, which is
+    # cheap because new strikes only appear when a new contract first ticks.
+    _by_symbol: dict[Symbol, dict[str, OptionState]] = field(default_factory=dict)
+    _by_expiry: dict[tuple[Symbol, datetime], dict[str, OptionState]] = field(default_factory=dict)
+    _by_strike: dict[tuple[Symbol, int], dict[str, OptionState]] = field(default_factory=dict)
+    _strikes: dict[Symbol, list[float]] = field(default_factory=dict)
+
     def apply_quote(self, quote: OptionQuoteEvent) -> OptionState | None:
         """
         Apply a raw quote event and return the updated state.
@@ -93,8 +127,11 @@ class OptionStore:
 
         Returns None if the symbol is invalid.
         """
-        # Garbage check: reject invalid quotes
-        if quote.bid < 0 or quote.ask < 0 or quote.bid > quote.ask:
+        # Garbage check: reject invalid quotes. The chained comparison folds
+        # bid >= 0, ask >= 0 and bid <= ask into one comparison pair.
+        bid = quote.bid
+        ask = quote.ask
+        if not 0.0 <= bid <= ask:
             return None
 
         parsed = parse_occ_symbol(quote.occ_symbol)
@@ -103,8 +140,10 @@ class OptionStore:
 
         symbol, expiration_date, option_type, strike = parsed
 
-        mid = (quote.bid + quote.ask) / 2
-        spread = quote.ask - quote.bid
+        # bid/ask are already locals from the validation above; * 0.5 skips
+        # the (slower) float division.
+        mid = (bid + ask) * 0.5
+        spread = ask - bid
 
         state = OptionState(
             occ_symbol=quote.occ_symbol,
@@ -112,19 +151,48 @@ class OptionStore:
             strike_price=strike,
             expiration_date=expiration_date,
             option_type=option_type,
-            bid=quote.bid,
-            ask=quote.ask,
+            bid=bid,
+            ask=ask,
             mid=mid,
             spread=spread,
             last_updated=quote.ts,
         )
 
-        self._states[quote.occ_symbol] = state
+        occ = quote.occ_symbol
+        self._states[occ] = state
+        self._by_symbol.setdefault(symbol, {})[occ] = state
+        self._by_expiry.setdefault((symbol, expiration_date), {})[occ] = state
+
+        strike_bucket = self._by_strike.get((symbol, round(strike * 1000)))
+        if strike_bucket is None:
+            strike_bucket = self._by_strike[(symbol, round(strike * 1000))] = {}
+            insort(self._strikes.setdefault(symbol, []), strike)
+        strike_bucket[occ] = state
+
         return state
 
+    def apply_quotes(self, quotes: Iterable[OptionQuoteEvent]) -> int:
+        """
+        Apply a batch of quote events in one call.
+
+        Returns the number of quotes that produced a state update. Lets hot
+        callers (the websocket listener) flush per message batch instead of
+        per quote.
+        """
+        applied = 0
+        apply = self.apply_quote  # bind once; the loop body is the hot path
+        for quote in quotes:
+            if apply(quote) is not None:
+                applied += 1
+        return applied
+
     def clear(self) -> None:
         """Clear all states."""
         self._states.clear()
+        self._by_symbol.clear()
+        self._by_expiry.clear()
+        self._by_strike.clear()
+        self._strikes.clear()
 
     # --- Read interface (StateReader) ---
 
@@ -136,18 +204,33 @@ class OptionStore:
         """Get all states (returns a shallow copy)."""
         return dict(self._states)
 
+    def states_view(self) -> Mapping[str, OptionState]:
+        """
+        Read-only O(1) view over all states — no copy.
+
+        For hot readers that iterate every tick; get_all() keeps its
+        copy-out contract for callers that want an independent dict.
+        """
+        return MappingProxyType(self._states)
+
     def get_by_symbol(self, symbol: Symbol) -> list[OptionState]:
         """Get all states for a stock symbol."""
-        return [s for s in self._states.values() if s.symbol == symbol]
+        index = self._by_symbol.get(symbol)
+        return list(index.values()) if index else []
+
+    def get_by_expiry(self, symbol: Symbol, expiration_date: datetime) -> list[OptionState]:
+        """Get all states for a symbol + expiry — the snapshot builder's unit."""
+        bucket = self._by_expiry.get((symbol, expiration_date))
+        return list(bucket.values()) if bucket else []
 
     def get_by_strike(self, symbol: Symbol, strike: float) -> list[OptionState]:
         """Get call and put for a specific symbol + strike."""
-        return [s for s in self._states.values() if s.symbol == symbol and s.strike_price == strike]
+        bucket = self._by_strike.get((symbol, round(strike * 1000)))
+        return list(bucket.values()) if bucket else []
 
     def get_strikes(self, symbol: Symbol) -> list[float]:
-        """Get all unique strikes for a symbol."""
-        strikes = {s.strike_price for s in self._states.values() if s.symbol == symbol}
-        return sorted(strikes)
+        """Get all unique strikes for a symbol (ascending)."""
+        return list(self._strikes.get(symbol, ()))
 
     def count(self) -> int:
         """Get total number of tracked options."""
@@ -7,10 +7,13 @@ Used as input to implied probability models.
 
 from collections.abc import Iterable
 from datetime import datetime
+from operator import attrgetter
 
 from domain.models import OptionPoint, OptionState, OptionSurfaceSnapshot
 from domain.types import Symbol
 
+_BY_STRIKE = attrgetter("strike")
+
 
 def build_surface_snapshot(
     *,
@@ -41,6 +44,11 @@ def build_surface_snapshot(
     calls: list[OptionPoint] = []
     puts: list[OptionPoint] = []
 
+    # Single filter-and-partition pass; bind the append methods once so the
+    # loop body is a handful of attribute loads per surviving state.
+    append_call = calls.append
+    append_put = puts.append
+
     for s in states:
         if s.symbol != symbol or s.expiration_date != expiration_date:
             continue
@@ -48,23 +56,18 @@ def build_surface_snapshot(
         if max_spread is not None and s.spread > max_spread:
             continue
 
-        point = OptionPoint(
-            strike=s.strike_price,
-            option_type=s.option_type,
-            bid=s.bid,
-            ask=s.ask,
-            mid=s.mid,
-            spread=s.spread,
-        )
+        # Positional construction (field order: strike, option_type, bid,
+        # ask, mid, spread) skips per-row keyword-argument parsing.
+        point = OptionPoint(s.strike_price, s.option_type, s.bid, s.ask, s.mid, s.spread)
 
         if s.option_type == "call":
-            calls.append(point)
+            append_call(point)
         else:
-            puts.append(point)
+            append_put(point)
 
-    # Sort by strike (ascending)
-    calls.sort(key=lambda p: p.strike)
-    puts.sort(key=lambda p: p.strike)
+    # Sort by strike (ascending); attrgetter keys skip per-element lambda frames
+    calls.sort(key=_BY_STRIKE)
+    puts.sort(key=_BY_STRIKE)
 
     return OptionSurfaceSnapshot(
         symbol=symbol,
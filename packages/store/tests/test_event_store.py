@@ -64,8 +64,8 @@ class TestEventStore:
     def test_empty_store(self) -> None:
         store = EventStore()
 
-        assert len(store.get_all()) == 0
-        assert store.get_all() == []
+        assert store.count() == 0
+        assert list(store.get_all()) == []
         assert store.last_refresh() is None
 
     def test_get_by_symbol_returns_empty_list_for_empty(self) -> None:
@@ -81,7 +81,7 @@ class TestEventStore:
         count = store.refresh()
 
         assert count == 4
-        assert len(store.get_all()) == 4
+        assert store.count() == 4
         assert store.last_refresh() is not None
 
     @patch("store.event_store.fetch_stock_events")
@@ -115,12 +115,25 @@ class TestEventStore:
         store = EventStore()
         store.refresh()
 
-        all_events = store.get_all()
+        all_events = list(store.get_all())
 
         assert len(all_events) == 4
         symbols = {e.symbol for e in all_events}
         assert symbols == {"NVDA", "AAPL", "TSLA"}
 
+    @patch("store.event_store.fetch_stock_events")
+    def test_events_view_is_read_only(self, mock_fetch: MagicMock, mock_events: list[EventMetadata]) -> None:
+        mock_fetch.return_value = mock_events
+        store = EventStore()
+        store.refresh()
+
+        view = store.events_view()
+
+        assert set(view) == {"NVDA", "AAPL", "TSLA"}
+        assert len(view["NVDA"]) == 2
+        with pytest.raises(TypeError):
+            view["MSFT"] = []  # type: ignore[index]
+
     @patch("store.event_store.fetch_stock_events")
     def test_clear_removes_all_events(self, mock_fetch: MagicMock, mock_events: list[EventMetadata]) -> None:
         mock_fetch.return_value = mock_events
@@ -129,7 +142,7 @@ class TestEventStore:
 
         store.clear()
 
-        assert store.get_all() == []
+        assert list(store.get_all()) == []
         assert store.last_refresh() is None
 
     @patch("store.event_store.fetch_stock_events")
@@ -148,7 +161,7 @@ class TestEventStore:
         ]
         store.refresh()
 
-        assert len(store.get_all()) == 2
+        assert store.count() == 2
         assert store.get_by_symbol("NVDA") == []
         assert len(store.get_by_symbol("AAPL")) == 1
 
@@ -164,7 +177,7 @@ class TestEventStore:
         count = store.refresh()
 
         assert count == 2
-        assert len(store.get_all()) == 2
+        assert store.count() == 2
 
     @patch("store.event_store.fetch_stock_events")
     def test_last_refresh_updates_on_refresh(self, mock_fetch: MagicMock) -> None:
@@ -189,7 +202,7 @@ class TestEventReaderProtocol:
 
         # This function accepts EventReader
         def use_reader(reader: EventReader) -> int:
-            return len(reader.get_all())
+            return reader.count()
 
         # EventStore should work as EventReader
         result = use_reader(store)
@@ -253,6 +266,12 @@ class TestGetMarket:
 
         assert market is None
 
+    def test_get_market_matches_strike_despite_float_noise(self, store_with_markets: EventStore) -> None:
+        market = store_with_markets.get_market("NVDA", "2026-01-10T00:00:00Z", 140.00000000001)
+
+        assert market is not None
+        assert market.strike_price == 140.0
+
     def test_get_market_returns_none_for_missing_strike(self, store_with_markets: EventStore) -> None:
         market = store_with_markets.get_market("NVDA", "2026-01-10T00:00:00Z", 999.0)
 
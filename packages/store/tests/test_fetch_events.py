@@ -14,6 +14,11 @@ from store.fetch_events import (
 )
 
 
+def _encode(payload: list) -> bytes:
+    """Serialize a fake Gamma API payload the way responses carry it."""
+    return json.dumps(payload).encode()
+
+
 class TestEventQuestionPattern:
     """Tests for EVENT_QUESTION_PATTERN regex."""
 
@@ -199,23 +204,25 @@ class TestFetchStockEvents:
     def test_fetches_matching_events(self, mock_session_cls: MagicMock) -> None:
         mock_session = mock_session_cls.return_value
         mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "id": "event1",
-                "title": "Will Amazon (AMZN) finish week of December 29 above___?",
-                "endDate": "2026-01-03T00:00:00Z",
-                "markets": [
-                    {
-                        "question": "Will Amazon (AMZN) finish week of December 29 above $200?",
-                        "questionID": "0x123",
-                        "clobTokenIds": json.dumps(["yes_token", "no_token"]),
-                        "outcomePrices": json.dumps(["0.6", "0.4"]),
-                        "orderPriceMinTickSize": "0.01",
-                        "negRisk": False,
-                    }
-                ],
-            }
-        ]
+        mock_response.content = _encode(
+            [
+                {
+                    "id": "event1",
+                    "title": "Will Amazon (AMZN) finish week of December 29 above___?",
+                    "endDate": "2026-01-03T00:00:00Z",
+                    "markets": [
+                        {
+                            "question": "Will Amazon (AMZN) finish week of December 29 above $200?",
+                            "questionID": "0x123",
+                            "clobTokenIds": json.dumps(["yes_token", "no_token"]),
+                            "outcomePrices": json.dumps(["0.6", "0.4"]),
+                            "orderPriceMinTickSize": "0.01",
+                            "negRisk": False,
+                        }
+                    ],
+                }
+            ]
+        )
         mock_response.raise_for_status = MagicMock()
         mock_session.get.return_value = mock_response
 
@@ -231,14 +238,16 @@ class TestFetchStockEvents:
     def test_filters_non_matching_events(self, mock_session_cls: MagicMock) -> None:
         mock_session = mock_session_cls.return_value
         mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "id": "event1",
-                "title": "Will Bitcoin reach $100k?",
-                "endDate": "2026-01-03T00:00:00Z",
-                "markets": [],
-            }
-        ]
+        mock_response.content = _encode(
+            [
+                {
+                    "id": "event1",
+                    "title": "Will Bitcoin reach $100k?",
+                    "endDate": "2026-01-03T00:00:00Z",
+                    "markets": [],
+                }
+            ]
+        )
         mock_response.raise_for_status = MagicMock()
         mock_session.get.return_value = mock_response
 
@@ -252,21 +261,23 @@ class TestFetchStockEvents:
         # Since we return 1 event (< 500), it stops after first call
         mock_session = mock_session_cls.return_value
         mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "id": "event1",
-                "title": "Will Amazon (AMZN) finish week of December 29 above___?",
-                "endDate": "2026-01-03T00:00:00Z",
-                "markets": [
-                    {
-                        "question": "Will Amazon (AMZN) finish week of December 29 above $200?",
-                        "questionID": "0x123",
-                        "clobTokenIds": json.dumps(["yes", "no"]),
-                        "outcomePrices": json.dumps(["0.6", "0.4"]),
-                    }
-                ],
-            }
-        ]
+        mock_response.content = _encode(
+            [
+                {
+                    "id": "event1",
+                    "title": "Will Amazon (AMZN) finish week of December 29 above___?",
+                    "endDate": "2026-01-03T00:00:00Z",
+                    "markets": [
+                        {
+                            "question": "Will Amazon (AMZN) finish week of December 29 above $200?",
+                            "questionID": "0x123",
+                            "clobTokenIds": json.dumps(["yes", "no"]),
+                            "outcomePrices": json.dumps(["0.6", "0.4"]),
+                        }
+                    ],
+                }
+            ]
+        )
         mock_response.raise_for_status = MagicMock()
         mock_session.get.return_value = mock_response
 
@@ -282,7 +293,7 @@ class TestFetchStockEvents:
     def test_handles_empty_response(self, mock_session_cls: MagicMock) -> None:
         mock_session = mock_session_cls.return_value
         mock_response = MagicMock()
-        mock_response.json.return_value = []
+        mock_response.content = b"[]"
         mock_response.raise_for_status = MagicMock()
         mock_session.get.return_value = mock_response
 
@@ -294,14 +305,16 @@ class TestFetchStockEvents:
     def test_skips_events_with_unknown_symbols(self, mock_session_cls: MagicMock) -> None:
         mock_session = mock_session_cls.return_value
         mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "id": "event1",
-                "title": "Will Unknown (UNKN) finish week of December 29 above___?",
-                "endDate": "2026-01-03T00:00:00Z",
-                "markets": [],
-            }
-        ]
+        mock_response.content = _encode(
+            [
+                {
+                    "id": "event1",
+                    "title": "Will Unknown (UNKN) finish week of December 29 above___?",
+                    "endDate": "2026-01-03T00:00:00Z",
+                    "markets": [],
+                }
+            ]
+        )
         mock_response.raise_for_status = MagicMock()
         mock_session.get.return_value = mock_response
 
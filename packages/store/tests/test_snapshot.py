@@ -67,6 +67,31 @@ class TestOptionSurfaceSnapshot:
     def test_get_put_not_found(self, snapshot: OptionSurfaceSnapshot) -> None:
         assert snapshot.get_put(999.0) is None
 
+    def test_call_columns(self, snapshot: OptionSurfaceSnapshot) -> None:
+        strikes, mids, spreads = snapshot.call_columns
+        assert strikes.tolist() == [90.0, 100.0, 110.0]
+        assert mids.tolist() == [12.25, 5.25, 1.25]
+        assert spreads.tolist() == [0.5, 0.5, 0.5]
+
+    def test_paired_columns(self, snapshot: OptionSurfaceSnapshot) -> None:
+        strikes, call_mid, call_spread, put_mid, put_spread = snapshot.paired_columns
+        assert strikes.tolist() == [90.0, 100.0, 110.0]
+        assert call_mid.tolist() == [12.25, 5.25, 1.25]
+        assert put_mid.tolist() == [1.25, 4.25, 10.25]
+
+    def test_paired_columns_skips_one_sided_strikes(self) -> None:
+        calls = (
+            OptionPoint(strike=90.0, option_type="call", bid=12.0, ask=12.5, mid=12.25, spread=0.5),
+            OptionPoint(strike=100.0, option_type="call", bid=5.0, ask=5.5, mid=5.25, spread=0.5),
+        )
+        puts = (OptionPoint(strike=100.0, option_type="put", bid=4.0, ask=4.5, mid=4.25, spread=0.5),)
+        snapshot = OptionSurfaceSnapshot(symbol=TEST_SYMBOL, expiration_date=TEST_EXPIRY, calls=calls, puts=puts)
+
+        strikes, call_mid, _, put_mid, _ = snapshot.paired_columns
+        assert strikes.tolist() == [100.0]
+        assert call_mid.tolist() == [5.25]
+        assert put_mid.tolist() == [4.25]
+
 
 class TestBuildSurfaceSnapshot:
     """Tests for build_surface_snapshot."""
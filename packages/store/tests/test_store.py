@@ -91,6 +91,19 @@ class TestOptionStore:
         assert state.ask == 6.5
         assert store.count() == 1
 
+    def test_apply_quotes_batch(self, store: OptionStore) -> None:
+        ts = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+        quotes = [
+            OptionQuoteEvent(occ_symbol="O:NVDA260117C00140000", bid=5.0, ask=5.5, ts=ts),
+            OptionQuoteEvent(occ_symbol="O:NVDA260117P00140000", bid=4.0, ask=4.5, ts=ts),
+            OptionQuoteEvent(occ_symbol="INVALID", bid=1.0, ask=1.5, ts=ts),
+        ]
+
+        applied = store.apply_quotes(quotes)
+
+        assert applied == 2
+        assert store.count() == 2
+
     def test_apply_quote_rejects_invalid_symbol(self, store: OptionStore) -> None:
         quote = OptionQuoteEvent(
             occ_symbol="INVALID",
@@ -149,6 +162,13 @@ class TestOptionStore:
         all_states.clear()
         assert store.count() == 1
 
+    def test_states_view_is_read_only(self, store: OptionStore, valid_quote: OptionQuoteEvent) -> None:
+        store.apply_quote(valid_quote)
+        view = store.states_view()
+        assert len(view) == 1
+        with pytest.raises(TypeError):
+            view["O:OTHER"] = None  # type: ignore[index]
+
     def test_get_by_symbol(self, store: OptionStore) -> None:
         ts = datetime.now(tz=UTC)
         store.apply_quote(OptionQuoteEvent(occ_symbol="O:NVDA260117C00140000", bid=5.0, ask=5.5, ts=ts))
@@ -159,6 +179,18 @@ class TestOptionStore:
         assert len(nvda_states) == 2
         assert all(s.symbol == "NVDA" for s in nvda_states)
 
+    def test_get_by_expiry(self, store: OptionStore) -> None:
+        ts = datetime.now(tz=UTC)
+        store.apply_quote(OptionQuoteEvent(occ_symbol="O:NVDA260117C00140000", bid=5.0, ask=5.5, ts=ts))
+        store.apply_quote(OptionQuoteEvent(occ_symbol="O:NVDA260117P00140000", bid=3.0, ask=3.5, ts=ts))
+        store.apply_quote(OptionQuoteEvent(occ_symbol="O:NVDA260220C00140000", bid=6.0, ask=6.5, ts=ts))
+
+        expiry = make_expiry_datetime("2026-01-17")
+        states = store.get_by_expiry("NVDA", expiry)
+        assert len(states) == 2
+        assert all(s.expiration_date == expiry for s in states)
+        assert store.get_by_expiry("NVDA", make_expiry_datetime("2026-03-20")) == []
+
     def test_get_by_strike(self, store: OptionStore) -> None:
         ts = datetime.now(tz=UTC)
         store.apply_quote(OptionQuoteEvent(occ_symbol="O:NVDA260117C00140000", bid=5.0, ask=5.5, ts=ts))